@@ -1,26 +1,29 @@
 """Clear database and downloads for fresh testing"""
-import sqlite3
+import os
 import shutil
+import threading
 from pathlib import Path
 
+from diagnostics import open_db
+
 print("\n" + "="*80)
 print("🧹 CLEARING DATABASE AND DOWNLOADS")
 print("="*80)
 
 # Clear database
 print("\n📊 Clearing database...")
-conn = sqlite3.connect('data/videos.db')
+conn = open_db('data/videos.db')
 cursor = conn.cursor()
 
-# Delete all videos
-cursor.execute("DELETE FROM videos")
-cursor.execute("DELETE FROM logs")
-cursor.execute("DELETE FROM stats")
-
-# Reset sequences
-cursor.execute("DELETE FROM sqlite_sequence")
-
-conn.commit()
+# Delete all rows and reset sequences in a single transaction (one commit)
+cursor.executescript("""
+    BEGIN IMMEDIATE;
+    DELETE FROM videos;
+    DELETE FROM logs;
+    DELETE FROM stats;
+    DELETE FROM sqlite_sequence;
+    COMMIT;
+""")
 print("✅ Database cleared!")
 
 # Show counts
@@ -33,14 +36,36 @@ conn.close()
 # Clear downloads folder
 print("\n📁 Clearing downloads folder...")
 downloads_dir = Path('downloads')
+trash_thread = None
+
+
+def _report_rmtree_error(func, path, exc_info):
+    print(f"   ⚠️ Could not delete {path}: {exc_info[1]}")
 
 if downloads_dir.exists():
+    # Renaming is O(1); the slow recursive delete happens in the background
+    trash_dir = Path(f'downloads.trash-{os.getpid()}')
+    trash_dir.mkdir(exist_ok=True)
+    
     deleted_count = 0
     for session_dir in downloads_dir.glob('session_*'):
         if session_dir.is_dir():
-            shutil.rmtree(session_dir)
+            try:
+                os.replace(session_dir, trash_dir / session_dir.name)
+                print(f"   Moved: {session_dir.name}")
+            except OSError:
+                # Windows refuses to rename directories with open handles
+                shutil.rmtree(session_dir, onerror=_report_rmtree_error)
+                print(f"   Deleted: {session_dir.name}")
             deleted_count += 1
-            print(f"   Deleted: {session_dir.name}")
+    
+    # Joined before exiting, so failures are reported
+    trash_thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(trash_dir,),
+        kwargs={'onerror': _report_rmtree_error}
+    )
+    trash_thread.start()
     
     print(f"✅ Cleared {deleted_count} session(s)")
 else:
@@ -50,10 +75,21 @@ else:
 print("\n📝 Clearing logs...")
 logs_dir = Path('logs')
 if logs_dir.exists():
-    for log_file in logs_dir.glob('*.log'):
-        log_file.unlink()
-        print(f"   Deleted: {log_file.name}")
-    print("✅ Logs cleared!")
+    deleted_count = 0
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.log') and entry.is_file():
+                os.unlink(entry.path)
+                deleted_count += 1
+    print(f"✅ Logs cleared! ({deleted_count} file(s))")
+
+if trash_thread:
+    print("\n🗑️ Waiting for moved sessions to be deleted...")
+    trash_thread.join()
+    if trash_dir.exists():
+        print(f"⚠️ Some files could not be deleted; they were left in {trash_dir}")
+    else:
+        print("✅ Moved sessions deleted")
 
 print("\n" + "="*80)
 print("✨ FRESH START READY!")
@@ -0,0 +1,534 @@
+"""
+Database Diagnostics
+Single entry point for inspecting the application databases.
+
+Replaces the ad-hoc check_both_dbs.py, check_videos.py, diagnose_uploads.py
+and full_diagnostic.py scripts, which each reopened the database and re-ran
+near-identical queries. One connection is opened per database and every
+requested report runs against it.
+
+Usage:
+    python diagnostics.py [MODE ...] [--db PATH] [--limit N] [--watch SECONDS]
+
+Modes: summary, recent, suspicious, logs, stats (default: all of them)
+"""
+import argparse
+import io
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+DATABASES = ('data/app.db', 'data/videos.db')
+MODES = ('summary', 'recent', 'suspicious', 'logs', 'stats')
+
+# Queries are module constants executed through conn.execute() with bound
+# parameters, so the text is identical on every call and sqlite3's
+# per-connection statement cache serves repeats without re-parsing.
+TABLES_SQL = "SELECT name FROM sqlite_master WHERE type='table'"
+
+# Per-status counts maintained by triggers (see DatabaseManager)
+STATUS_COUNTS_SQL = "SELECT status, n, 0 FROM status_counts WHERE n > 0"
+
+SUSPICIOUS_COUNT_SQL = """
+    SELECT COUNT(*)
+    FROM videos
+    WHERE status IN ('uploaded', 'completed')
+    AND target_video_id IS NULL
+"""
+
+# Fallback for databases without status_counts: one scan yields the status
+# breakdown, the total and the suspicious count
+STATUS_SQL = """
+    SELECT
+        status,
+        COUNT(*) AS count,
+        SUM(status IN ('uploaded', 'completed') AND target_video_id IS NULL) AS suspicious
+    FROM videos
+    GROUP BY status
+"""
+
+RECENT_SQL = """
+    SELECT
+        source_video_id,
+        source_title,
+        status,
+        target_video_id,
+        downloaded_at,
+        uploaded_at,
+        error_message,
+        created_at
+    FROM videos
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+SUSPICIOUS_SQL = """
+    SELECT
+        source_video_id,
+        source_title,
+        status,
+        uploaded_at
+    FROM videos
+    WHERE status IN ('uploaded', 'completed')
+    AND target_video_id IS NULL
+    LIMIT ?
+"""
+
+LOGS_SQL = """
+    SELECT
+        timestamp,
+        level,
+        module,
+        message,
+        details
+    FROM logs
+    WHERE category = 'upload' OR level = 'ERROR'
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+# Fallback for databases created before logs.category existed
+LEGACY_LOGS_SQL = """
+    SELECT
+        timestamp,
+        level,
+        module,
+        message,
+        details
+    FROM logs
+    WHERE message LIKE '%upload%' OR message LIKE '%ERROR%' OR level = 'ERROR'
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+STATS_SQL = """
+    SELECT
+        date,
+        videos_detected,
+        videos_downloaded,
+        videos_uploaded,
+        errors_count
+    FROM stats
+    ORDER BY date DESC
+    LIMIT ?
+"""
+
+# Row limits used when the caller does not pass one (None = no limit)
+DEFAULT_LIMITS: Dict[str, Optional[int]] = {
+    'recent': None,
+    'suspicious': 20,
+    'logs': 20,
+    'stats': 7,
+}
+
+
+def open_db(db_path: str) -> sqlite3.Connection:
+    """
+    Open a database connection for the maintenance scripts.
+
+    WAL keeps the scripts from blocking the running application (and vice
+    versa), synchronous=NORMAL drops the extra fsync per commit and the busy
+    timeout waits for the app's writer instead of failing with
+    "database is locked".
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        Configured SQLite connection
+    """
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+    conn.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+    return conn
+
+
+def nonempty(conn: sqlite3.Connection, table: str) -> bool:
+    """
+    Check whether a table has at least one row without scanning it.
+
+    Args:
+        conn: Open database connection
+        table: Table name (trusted identifier, not user input)
+
+    Returns:
+        True if the table exists and has rows, False otherwise
+    """
+    try:
+        return bool(conn.execute(f"SELECT EXISTS(SELECT 1 FROM {table})").fetchone()[0])
+    except sqlite3.OperationalError:  # Table does not exist
+        return False
+
+
+def _sql_limit(limit: Optional[int]) -> int:
+    """Translate an optional limit into SQLite's LIMIT value (-1 = unbounded)."""
+    return -1 if limit is None else limit
+
+
+def _status_breakdown(
+    conn: sqlite3.Connection,
+    shared: Dict[str, Any]
+) -> Tuple[List[Tuple[str, int]], int]:
+    """
+    Get per-status counts and the suspicious entry total.
+
+    Read from the trigger-maintained status_counts table when present,
+    otherwise computed with a single aggregate scan. Cached in ``shared`` so
+    the summary and suspicious reports of one run share the work.
+
+    Returns:
+        Tuple of ([(status, count), ...], suspicious_total)
+    """
+    if 'status_counts' not in shared:
+        has_counts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'status_counts'"
+        ).fetchone() is not None
+
+        if has_counts:
+            rows = conn.execute(STATUS_COUNTS_SQL).fetchall()
+            suspicious_total = conn.execute(SUSPICIOUS_COUNT_SQL).fetchone()[0]
+        else:
+            rows = conn.execute(STATUS_SQL).fetchall()
+            suspicious_total = sum(suspicious for _, _, suspicious in rows)
+
+        shared['status_counts'] = [(status, count) for status, count, _ in rows]
+        shared['suspicious_total'] = suspicious_total
+    return shared['status_counts'], shared['suspicious_total']
+
+
+def _print_header(out: TextIO, title: str) -> None:
+    print("\n" + "="*80, file=out)
+    print(title, file=out)
+    print("="*80, file=out)
+
+
+def _report_summary(
+    conn: sqlite3.Connection,
+    limit: Optional[int],
+    shared: Dict[str, Any],
+    out: TextIO
+) -> None:
+    """Tables, video count and status breakdown."""
+    tables = [row[0] for row in conn.execute(TABLES_SQL)]
+    print(f"\n📊 Tables: {', '.join(tables)}", file=out)
+
+    if 'videos' not in tables:
+        return
+
+    status_counts, _ = _status_breakdown(conn, shared)
+    count = sum(cnt for _, cnt in status_counts)
+    print(f"\n📹 Total videos in database: {count}", file=out)
+
+    if count > 0:
+        print("\n📊 Status breakdown:", file=out)
+        for status, cnt in status_counts:
+            print(f"   {status}: {cnt}", file=out)
+
+
+def _report_recent(
+    conn: sqlite3.Connection,
+    limit: Optional[int],
+    shared: Dict[str, Any],
+    out: TextIO
+) -> None:
+    """Most recently created videos with their upload state."""
+    print("\n📋 Recent videos:", file=out)
+
+    # Iterate the cursor directly so rows stream instead of being materialized
+    for i, row in enumerate(conn.execute(RECENT_SQL, (_sql_limit(limit),)), 1):
+        (source_id, title, status, target_id, downloaded_at,
+         uploaded_at, error, created_at) = row
+
+        print(f"\n{i}. {title[:70] if title else 'N/A'}", file=out)
+        print(f"   📺 Source ID: {source_id}", file=out)
+        print(f"   📊 Status: {status}", file=out)
+        print(f"   🕒 Created: {created_at}", file=out)
+        print(f"   📥 Downloaded At: {downloaded_at}", file=out)
+        print(f"   📤 Uploaded At: {uploaded_at if uploaded_at else 'Never'}", file=out)
+
+        if target_id:
+            print(f"   ✅ Target Video ID: {target_id}", file=out)
+            print(f"   🔗 YouTube URL: https://youtube.com/watch?v={target_id}", file=out)
+        else:
+            print("   ❌ Target Video ID: NULL", file=out)
+
+        if error:
+            print(f"   ⚠️ Error: {error[:200]}", file=out)
+
+        if status == 'completed' and not target_id:
+            print("   🚨 BUG DETECTED: Status is 'completed' but no target_video_id!", file=out)
+
+
+def _report_suspicious(
+    conn: sqlite3.Connection,
+    limit: Optional[int],
+    shared: Dict[str, Any],
+    out: TextIO
+) -> None:
+    """Videos marked uploaded/completed without a target video ID."""
+    print("\n⚠️ SUSPICIOUS ENTRIES (Status='uploaded' but no target_video_id):", file=out)
+
+    _, suspicious_total = _status_breakdown(conn, shared)
+
+    if suspicious_total:
+        print(f"\n🚨 Found {suspicious_total} suspicious entries:", file=out)
+        if limit is not None and suspicious_total > limit:
+            print(f"   (showing the first {limit})", file=out)
+        for source_id, title, status, uploaded_at in conn.execute(SUSPICIOUS_SQL, (_sql_limit(limit),)):
+            print(f"\n   Video: {title[:60] if title else 'N/A'}", file=out)
+            print(f"   Source ID: {source_id}", file=out)
+            print(f"   Status: {status}", file=out)
+            print(f"   Uploaded At: {uploaded_at}", file=out)
+    else:
+        print("\n✅ No suspicious entries found.", file=out)
+
+
+def _report_logs(
+    conn: sqlite3.Connection,
+    limit: Optional[int],
+    shared: Dict[str, Any],
+    out: TextIO
+) -> None:
+    """Recent upload-related and error log entries."""
+    print("\n📋 RECENT UPLOAD-RELATED LOGS AND ERRORS:", file=out)
+
+    log_columns = {row[1] for row in conn.execute("PRAGMA table_info(logs)")}
+    logs_sql = LOGS_SQL if 'category' in log_columns else LEGACY_LOGS_SQL
+
+    found = False
+    for timestamp, level, module, message, details in conn.execute(logs_sql, (_sql_limit(limit),)):
+        found = True
+        print(f"\n[{timestamp}] [{level}] {module if module else 'N/A'}", file=out)
+        print(f"   Message: {message}", file=out)
+        if details:
+            print(f"   Details: {details[:200]}", file=out)
+
+    if not found:
+        print("\n⚠️ No upload-related or error logs found.", file=out)
+
+
+def _report_stats(
+    conn: sqlite3.Connection,
+    limit: Optional[int],
+    shared: Dict[str, Any],
+    out: TextIO
+) -> None:
+    """Daily statistics table."""
+    print("\n📊 STATISTICS TABLE:", file=out)
+
+    stats = conn.execute(STATS_SQL, (_sql_limit(limit),)).fetchall()
+
+    if stats:
+        print("\n   Date       | Detected | Downloaded | Uploaded | Errors", file=out)
+        print("   " + "-"*60, file=out)
+        for date, detected, downloaded, uploaded, errors in stats:
+            print(f"   {date} | {detected:8} | {downloaded:10} | {uploaded:8} | {errors:6}", file=out)
+    else:
+        print("\n⚠️ No statistics found.", file=out)
+
+
+# Each report receives the connection, its row limit, a dict of values
+# shared between the reports of one run and the stream to write to
+_REPORTS: Dict[str, Callable[[sqlite3.Connection, Optional[int], Dict[str, Any], TextIO], None]] = {
+    'summary': _report_summary,
+    'recent': _report_recent,
+    'suspicious': _report_suspicious,
+    'logs': _report_logs,
+    'stats': _report_stats,
+}
+
+
+# Reports that only list rows of the videos table
+_VIDEO_REPORTS = frozenset({'recent', 'suspicious'})
+
+
+def _check_modes(modes: Sequence[str]) -> Sequence[str]:
+    """Validate requested report modes, defaulting to all of them."""
+    modes = modes or MODES
+    for mode in modes:
+        if mode not in _REPORTS:
+            raise ValueError(f"Unknown diagnostic mode: {mode}")
+    return modes
+
+
+def _missing(db_path: str) -> str:
+    return f"\n❌ {db_path} does not exist\n"
+
+
+def _render_with(
+    conn: sqlite3.Connection,
+    db_path: str,
+    modes: Sequence[str],
+    limit: Optional[int]
+) -> str:
+    """Run the reports on an open connection and return their text."""
+    out = io.StringIO()
+    _print_header(out, f"📂 DATABASE: {db_path}")
+
+    # With no videos recorded the per-video reports have nothing to list,
+    # but the summary, logs and stats may show why
+    if not nonempty(conn, 'videos'):
+        skipped = [mode for mode in modes if mode in _VIDEO_REPORTS]
+        if skipped:
+            print(f"\n(no videos recorded; skipping {', '.join(skipped)})", file=out)
+            modes = [mode for mode in modes if mode not in _VIDEO_REPORTS]
+
+    shared: Dict[str, Any] = {}
+    # One read transaction for all reports: a consistent snapshot, and the
+    # page cache stays warm from one query to the next
+    conn.execute("BEGIN DEFERRED")
+    try:
+        for mode in modes:
+            mode_limit = limit if mode == 'recent' else DEFAULT_LIMITS.get(mode)
+            _REPORTS[mode](conn, mode_limit, shared, out)
+    finally:
+        conn.commit()
+
+    print("\n" + "="*80, file=out)
+    return out.getvalue()
+
+
+def render(db_path: str, *modes: str, limit: Optional[int] = None) -> str:
+    """
+    Build one or more diagnostic reports for a database.
+
+    Output is collected in memory rather than printed so several databases
+    can be inspected concurrently without interleaving their lines.
+
+    Args:
+        db_path: Path to SQLite database file
+        *modes: Reports to run (summary, recent, suspicious, logs, stats);
+            all of them when omitted
+        limit: Row limit for the recent videos report (default: no limit)
+
+    Returns:
+        Formatted report text
+    """
+    modes = _check_modes(modes)
+
+    if not Path(db_path).exists():
+        return _missing(db_path)
+
+    conn = open_db(db_path)
+    try:
+        return _render_with(conn, db_path, modes, limit)
+    finally:
+        conn.close()
+
+
+def report(db_path: str, *modes: str, limit: Optional[int] = None) -> None:
+    """
+    Print one or more diagnostic reports for a database.
+
+    Args:
+        db_path: Path to SQLite database file
+        *modes: Reports to run; all of them when omitted
+        limit: Row limit for the recent videos report (default: no limit)
+    """
+    sys.stdout.write(render(db_path, *modes, limit=limit))
+    sys.stdout.flush()
+
+
+def report_many(
+    db_paths: Sequence[str],
+    *modes: str,
+    limit: Optional[int] = None
+) -> None:
+    """
+    Print diagnostic reports for several databases, inspecting them concurrently.
+
+    The databases are independent and SQLite releases the GIL while it
+    works, so each one is rendered on its own thread; output keeps the
+    order of ``db_paths``.
+
+    Args:
+        db_paths: Paths to SQLite database files
+        *modes: Reports to run; all of them when omitted
+        limit: Row limit for the recent videos report (default: no limit)
+    """
+    if not db_paths:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(db_paths)) as executor:
+        outputs = list(executor.map(
+            lambda db_path: render(db_path, *modes, limit=limit), db_paths
+        ))
+
+    # One write for the whole run instead of one per line/database
+    sys.stdout.write(''.join(outputs))
+    sys.stdout.flush()
+
+
+def watch(
+    db_paths: Sequence[str],
+    *modes: str,
+    interval: float,
+    limit: Optional[int] = None
+) -> None:
+    """
+    Re-run the reports every ``interval`` seconds until interrupted.
+
+    Connections stay open between runs, so after the first pass the
+    queries are served from SQLite's page cache instead of disk.
+
+    Args:
+        db_paths: Paths to SQLite database files
+        *modes: Reports to run; all of them when omitted
+        interval: Seconds to wait between runs
+        limit: Row limit for the recent videos report (default: no limit)
+    """
+    modes = _check_modes(modes)
+    connections = {
+        db_path: open_db(db_path) for db_path in db_paths if Path(db_path).exists()
+    }
+
+    try:
+        while True:
+            outputs = [
+                _render_with(connections[db_path], db_path, modes, limit)
+                if db_path in connections else _missing(db_path)
+                for db_path in db_paths
+            ]
+            sys.stdout.write(''.join(outputs))
+            sys.stdout.flush()
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for conn in connections.values():
+            conn.close()
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Inspect the application databases")
+    parser.add_argument('modes', nargs='*', metavar='MODE',
+                        help=f"Reports to run ({', '.join(MODES)})")
+    parser.add_argument('--db', action='append', dest='databases',
+                        help="Database path (repeatable, default: data/videos.db)")
+    parser.add_argument('--limit', type=int, default=None,
+                        help="Maximum number of recent videos to show")
+    parser.add_argument('--watch', type=float, default=None, metavar='SECONDS',
+                        help="Keep running and refresh the reports every SECONDS")
+    args = parser.parse_args()
+
+    unknown = [mode for mode in args.modes if mode not in MODES]
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(unknown)}")
+
+    databases = args.databases or ['data/videos.db']
+    if args.watch:
+        watch(databases, *args.modes, interval=args.watch, limit=args.limit)
+    else:
+        report_many(databases, *args.modes, limit=args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,29 +4,38 @@ Demonstrates how Phase 2 modules work together.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from youtube.api_client import YouTubeAPIClient
-from youtube.downloader import VideoDownloader
-from youtube.uploader import VideoUploader
-from youtube.monitor import ChannelMonitor
-from core.database import DatabaseManager
-from core.logger import setup_logger
+# Module imports live inside each example: google-api-python-client and
+# yt-dlp are slow to import and are only needed by the examples that run.
+
+
+@lru_cache(maxsize=None)
+def get_api_client():
+    """Create the API client once and share it between examples."""
+    from youtube.api_client import YouTubeAPIClient
+    
+    return YouTubeAPIClient(
+        credentials_file="config/client_secrets.json",
+        token_file="config/token.pickle"
+    )
 
 
 def example_1_basic_download_upload():
     """Example 1: Download a video and upload it."""
     print("\n=== Example 1: Basic Download & Upload ===\n")
     
+    from core.logger import setup_logger
+    from youtube.downloader import VideoDownloader
+    from youtube.uploader import VideoUploader
+    
     # Setup
     logger = setup_logger("youtube_example", "logs/example.log")
-    api_client = YouTubeAPIClient(
-        credentials_file="config/client_secrets.json",
-        token_file="config/token.pickle"
-    )
+    api_client = get_api_client()
     downloader = VideoDownloader(output_dir="downloads")
     uploader = VideoUploader(api_client)
     
@@ -71,12 +80,13 @@ def example_2_channel_monitoring():
     """Example 2: Monitor a channel for new videos."""
     print("\n=== Example 2: Channel Monitoring ===\n")
     
+    from core.database import DatabaseManager
+    from core.logger import setup_logger
+    from youtube.monitor import ChannelMonitor
+    
     # Setup
     logger = setup_logger("monitoring_example", "logs/monitoring.log")
-    api_client = YouTubeAPIClient(
-        credentials_file="config/client_secrets.json",
-        token_file="config/token.pickle"
-    )
+    api_client = get_api_client()
     database = DatabaseManager("data/videos.db")
     
     # Create monitor
@@ -121,6 +131,8 @@ def example_3_metadata_extraction():
     """Example 3: Extract video metadata without downloading."""
     print("\n=== Example 3: Metadata Extraction ===\n")
     
+    from youtube.downloader import VideoDownloader
+    
     downloader = VideoDownloader(output_dir="downloads")
     
     video_id = "dQw4w9WgXcQ"
@@ -145,10 +157,7 @@ def example_4_quota_management():
     """Example 4: Check and track API quota usage."""
     print("\n=== Example 4: Quota Management ===\n")
     
-    api_client = YouTubeAPIClient(
-        credentials_file="config/client_secrets.json",
-        token_file="config/token.pickle"
-    )
+    api_client = get_api_client()
     
     # Check current quota
     quota_info = api_client.get_quota_usage()
@@ -172,14 +181,17 @@ def example_5_complete_replication_flow():
     """Example 5: Complete video replication workflow."""
     print("\n=== Example 5: Complete Replication Flow ===\n")
     
+    from core.database import DatabaseManager
+    from core.logger import setup_logger
+    from youtube.downloader import VideoDownloader
+    from youtube.monitor import ChannelMonitor
+    from youtube.uploader import VideoUploader
+    
     # This demonstrates the full workflow:
     # Monitor → Detect → Download → Upload → Track
     
     logger = setup_logger("replication", "logs/replication.log")
-    api_client = YouTubeAPIClient(
-        credentials_file="config/client_secrets.json",
-        token_file="config/token.pickle"
-    )
+    api_client = get_api_client()
     database = DatabaseManager("data/videos.db")
     downloader = VideoDownloader(output_dir="downloads")
     uploader = VideoUploader(api_client)
@@ -1,58 +1,98 @@
 """Fix corrupted database entries and check upload configuration"""
+import os
 import sqlite3
+import sys
 from pathlib import Path
+from typing import Optional
+
+from diagnostics import open_db
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+from core.database import DatabaseManager
+
+try:
+    from orjson import loads as json_loads  # Optional, faster parser
+except ImportError:
+    from json import loads as json_loads
 
 print("\n" + "="*80)
 print("🔧 FIXING DATABASE + CHECKING UPLOAD CONFIGURATION")
 print("="*80)
 
 # Fix database
-conn = sqlite3.connect('data/videos.db')
+conn = open_db('data/videos.db')
 cursor = conn.cursor()
 
 print("\n1️⃣ Fixing corrupted database entries...")
 print("-"*80)
 
-# Find videos marked as completed but with NULL target_video_id
-cursor.execute("""
-    SELECT source_video_id, source_title, status
-    FROM videos
+# Mark videos that are 'completed' but have no target_video_id as failed
+FIX_CORRUPTED_SQL = """
+    UPDATE videos
+    SET status = 'failed',
+        error_message = 'Upload failed: No video ID returned from YouTube API (status was incorrectly marked as completed)'
     WHERE status = 'completed'
     AND target_video_id IS NULL
-""")
-
-corrupted = cursor.fetchall()
+"""
 
-if corrupted:
-    print(f"\n🔍 Found {len(corrupted)} corrupted entries:")
-    for video in corrupted:
-        source_id, title, status = video
-        print(f"   - {title[:60]}")
-        print(f"     Source ID: {source_id}")
-    
-    # Update status to 'failed'
+if sqlite3.sqlite_version_info >= (3, 35, 0):
+    # Update and report the affected rows in a single statement
+    corrupted = cursor.execute(
+        FIX_CORRUPTED_SQL + " RETURNING source_video_id, source_title"
+    ).fetchall()
+else:
     cursor.execute("""
-        UPDATE videos
-        SET status = 'failed',
-            error_message = 'Upload failed: No video ID returned from YouTube API (status was incorrectly marked as completed)'
+        SELECT source_video_id, source_title
+        FROM videos
         WHERE status = 'completed'
         AND target_video_id IS NULL
     """)
+    corrupted = cursor.fetchall()
+    if corrupted:
+        cursor.execute(FIX_CORRUPTED_SQL)
+
+conn.commit()
+
+if corrupted:
+    print(f"\n🔍 Found {len(corrupted)} corrupted entries:")
+    for source_id, title in corrupted:
+        print(f"   - {title[:60] if title else 'N/A'}")
+        print(f"     Source ID: {source_id}")
     
-    conn.commit()
-    print(f"\n✅ Updated {cursor.rowcount} videos to 'failed' status")
+    print(f"\n✅ Updated {len(corrupted)} videos to 'failed' status")
 else:
     print("\n✅ No corrupted entries found")
 
-# Check current video status
-print("\n2️⃣ Current video status summary:")
+# Make sure the diagnostic query indexes exist on older databases
+print("\n2️⃣ Updating database schema:")
 print("-"*80)
 
-cursor.execute("""
-    SELECT status, COUNT(*) as count
-    FROM videos
-    GROUP BY status
+# DatabaseManager idempotently adds the indexes, the logs.category column
+# and the trigger-maintained status_counts table to older databases
+DatabaseManager('data/videos.db').close()
+
+# Logs are filtered by category instead of LIKE '%upload%' message scans
+cursor.executescript("""
+    BEGIN;
+    UPDATE logs
+    SET category = CASE
+        WHEN lower(coalesce(module, '') || ' ' || message) LIKE '%upload%' THEN 'upload'
+        WHEN lower(coalesce(module, '') || ' ' || message) LIKE '%download%' THEN 'download'
+        WHEN lower(coalesce(module, '') || ' ' || message) LIKE '%monitor%' THEN 'monitor'
+    END
+    WHERE category IS NULL;
+    COMMIT;
+
+    ANALYZE;
 """)
+print("   ✅ Schema up to date (indexes, log categories, status counts)")
+print("   ✅ Statistics refreshed (ANALYZE)")
+
+# Check current video status
+print("\n3️⃣ Current video status summary:")
+print("-"*80)
+
+cursor.execute("SELECT status, n FROM status_counts WHERE n > 0")
 
 for status, count in cursor.fetchall():
     print(f"   {status}: {count}")
@@ -60,35 +100,43 @@ for status, count in cursor.fetchall():
 conn.close()
 
 # Check upload configuration
-print("\n3️⃣ Checking upload configuration:")
+print("\n4️⃣ Checking upload configuration:")
 print("-"*80)
 
+
+def stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Single stat() call answering both "does it exist" and "size/mtime"."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
 # Check if OAuth token exists
 token_file = Path('token.json')
-if token_file.exists():
+token_stat = stat_or_none(token_file)
+if token_stat:
     print(f"   ✅ OAuth token file exists: {token_file}")
-    print(f"      Size: {token_file.stat().st_size} bytes")
-    print(f"      Modified: {token_file.stat().st_mtime}")
+    print(f"      Size: {token_stat.st_size} bytes")
+    print(f"      Modified: {token_stat.st_mtime}")
 else:
     print(f"   ❌ OAuth token file NOT found: {token_file}")
     print(f"      This is likely why uploads are failing!")
 
 # Check client secrets
 client_secrets = Path('client_secrets.json')
-if client_secrets.exists():
+if stat_or_none(client_secrets):
     print(f"   ✅ Client secrets file exists: {client_secrets}")
 else:
     print(f"   ❌ Client secrets file NOT found: {client_secrets}")
 
 # Check config
 config_file = Path('config.json')
-if config_file.exists():
+if stat_or_none(config_file):
     print(f"   ✅ Config file exists: {config_file}")
     
-    import json
     try:
-        with open(config_file) as f:
-            config = json.load(f)
+        config = json_loads(config_file.read_bytes())
         
         # Check upload settings
         upload_settings = config.get('upload', {})
@@ -101,7 +149,7 @@ if config_file.exists():
 else:
     print(f"   ❌ Config file NOT found: {config_file}")
 
-print("\n4️⃣ Recommendations:")
+print("\n5️⃣ Recommendations:")
 print("-"*80)
 
 print("""
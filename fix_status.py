@@ -1,26 +1,50 @@
-"""Fix the status of successfully uploaded video"""
-import sqlite3
+"""Mark successfully uploaded videos as completed
 
-conn = sqlite3.connect('data/videos.db')
-cursor = conn.cursor()
+Usage:
+    python fix_status.py VIDEO_ID [VIDEO_ID ...]
+    python fix_status.py < video_ids.txt
+"""
+import sys
 
-# Update the successfully uploaded video status
-cursor.execute("""
-    UPDATE videos 
-    SET status = 'completed', 
-        uploaded_at = datetime('now'),
-        error_message = NULL
-    WHERE source_video_id = 'jKZQyAAA6V0'
-""")
+from diagnostics import open_db
 
-conn.commit()
+video_ids = sys.argv[1:]
+# Only read IDs from stdin when it's piped, never wait on a terminal
+if not video_ids and not sys.stdin.isatty():
+    video_ids = [line.strip() for line in sys.stdin if line.strip()]
 
-print("\n✅ Fixed video status!")
-print(f"   Updated: jKZQyAAA6V0 -> Status: completed")
+if not video_ids:
+    print("Usage: python fix_status.py VIDEO_ID [VIDEO_ID ...]")
+    print("       python fix_status.py < video_ids.txt")
+    sys.exit(1)
+
+conn = open_db('data/videos.db')
+
+# Update every video in one transaction (the with block commits once)
+with conn:
+    conn.executemany("""
+        UPDATE videos
+        SET status = 'completed',
+            uploaded_at = datetime('now'),
+            error_message = NULL
+        WHERE source_video_id = ?
+    """, [(video_id,) for video_id in video_ids])
 
 # Verify
-cursor.execute("SELECT source_video_id, status, target_video_id FROM videos WHERE source_video_id = 'jKZQyAAA6V0'")
-row = cursor.fetchone()
-print(f"   Verified: {row[0]} - Status: {row[1]} - Uploaded: {row[2]}")
+placeholders = ', '.join('?' * len(video_ids))
+rows = conn.execute(f"""
+    SELECT source_video_id, status, target_video_id
+    FROM videos
+    WHERE source_video_id IN ({placeholders})
+""", video_ids).fetchall()
+
+found = {row[0] for row in rows}
+fixed = sum(1 for _, status, _ in rows if status == 'completed')
+print(f"\n✅ Fixed status of {fixed} video(s)!")
+for source_id, status, target_id in rows:
+    print(f"   Verified: {source_id} - Status: {status} - Uploaded: {target_id}")
+for video_id in video_ids:
+    if video_id not in found:
+        print(f"   ❌ Not found: {video_id}")
 
 conn.close()
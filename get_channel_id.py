@@ -2,17 +2,47 @@
 Helper script to get Channel ID from YouTube handle/username or URL
 Usage: python get_channel_id.py @SnaxGaming
        python get_channel_id.py https://www.youtube.com/@SnaxGaming
+       python get_channel_id.py @SnaxGaming --no-stats
+       python get_channel_id.py @SnaxGaming --refresh
 """
 
+import json
 import sys
 import re
 import os
+import time
+from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from youtube.api_client import YouTubeAPIClient
 
+# Full channel URL - https://www.youtube.com/@SnaxGaming
+_YT_URL_RE = re.compile(r'youtube\.com/@([^/?]+)')
+
+# Lookups are cached for a day so repeated runs don't spend API quota
+CACHE_FILE = Path(__file__).resolve().parent / 'data' / 'channel_cache.json'
+CACHE_TTL = 24 * 60 * 60
+
+
+def _load_cache() -> dict:
+    """Load the handle cache, treating a missing or corrupt file as empty."""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict):
+    """Write the handle cache atomically."""
+    CACHE_FILE.parent.mkdir(exist_ok=True)
+    tmp_path = CACHE_FILE.with_name(CACHE_FILE.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, CACHE_FILE)
+
 
 def extract_handle(input_str: str) -> str:
     """
@@ -28,8 +58,7 @@ def extract_handle(input_str: str) -> str:
     input_str = input_str.strip()
     
     # Pattern 1: Full URL - https://www.youtube.com/@SnaxGaming
-    url_pattern = r'youtube\.com/@([^/?]+)'
-    match = re.search(url_pattern, input_str)
+    match = _YT_URL_RE.search(input_str)
     if match:
         return match.group(1)
     
@@ -41,12 +70,53 @@ def extract_handle(input_str: str) -> str:
     return input_str
 
 
-def get_channel_id_from_handle(handle: str) -> dict:
+def get_channel_id_from_handle(handle: str, include_stats: bool = True,
+                               refresh: bool = False) -> dict:
+    """
+    Get channel ID and details from handle, using the local cache when fresh.
+    
+    Args:
+        handle: YouTube handle (without @)
+        include_stats: Also fetch subscriber/video/view counts and custom URL
+        refresh: Ignore any cached entry and query the API again
+        
+    Returns:
+        Dictionary with channel details
+    """
+    key = handle.lower()
+    cache = _load_cache()
+    entry = cache.get(key)
+    
+    if (not refresh and entry
+            and time.time() - entry['fetched_at'] < CACHE_TTL
+            and (entry['has_stats'] or not include_stats)):
+        return entry['result']
+    
+    result = fetch_channel(handle, include_stats)
+    
+    # Errors are not cached so a transient failure can be retried
+    if 'error' not in result:
+        cache[key] = {
+            'fetched_at': time.time(),
+            'has_stats': include_stats,
+            'result': result,
+        }
+        _save_cache(cache)
+    
+    return result
+
+
+def fetch_channel(handle: str, include_stats: bool = True) -> dict:
     """
     Get channel ID and details from handle using YouTube API.
     
+    The search result already carries the channel ID, title and description;
+    the second (channels.list) round-trip is only made when statistics are
+    requested.
+    
     Args:
         handle: YouTube handle (without @)
+        include_stats: Also fetch subscriber/video/view counts and custom URL
         
     Returns:
         Dictionary with channel details
@@ -70,7 +140,19 @@ def get_channel_id_from_handle(handle: str) -> dict:
         
         # Get the first result (usually the correct one)
         channel_snippet = response['items'][0]['snippet']
-        channel_id = response['items'][0]['snippet']['channelId']
+        channel_id = channel_snippet['channelId']
+        description = channel_snippet.get('description', '')
+        
+        result = {
+            'channel_id': channel_id,
+            'channel_name': channel_snippet.get('title', ''),
+            'channel_url': f'https://www.youtube.com/channel/{channel_id}',
+            'handle': f"@{handle}",
+            'description': description[:200] + '...' if len(description) > 200 else description,
+        }
+        
+        if not include_stats:
+            return result
         
         # Get full channel details
         channel_request = client.youtube.channels().list(
@@ -83,32 +165,39 @@ def get_channel_id_from_handle(handle: str) -> dict:
             return {'error': 'Channel details not found'}
         
         channel = channel_response['items'][0]
+        snippet, stats = channel['snippet'], channel['statistics']
+        description = snippet['description']
         
-        return {
-            'channel_id': channel_id,
-            'channel_name': channel['snippet']['title'],
-            'channel_url': f'https://www.youtube.com/channel/{channel_id}',
-            'handle': f"@{channel['snippet'].get('customUrl', handle)}",
-            'description': channel['snippet']['description'][:200] + '...' if len(channel['snippet']['description']) > 200 else channel['snippet']['description'],
-            'subscriber_count': channel['statistics'].get('subscriberCount', 'Hidden'),
-            'video_count': channel['statistics'].get('videoCount', '0'),
-            'view_count': channel['statistics'].get('viewCount', '0'),
-        }
+        result.update({
+            'channel_name': snippet['title'],
+            'handle': f"@{snippet.get('customUrl', handle)}",
+            'description': description[:200] + '...' if len(description) > 200 else description,
+            'subscriber_count': stats.get('subscriberCount', 'Hidden'),
+            'video_count': stats.get('videoCount', '0'),
+            'view_count': stats.get('viewCount', '0'),
+        })
+        return result
         
     except Exception as e:
         return {'error': f'Error: {str(e)}'}
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python get_channel_id.py <handle_or_url>")
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    include_stats = '--no-stats' not in sys.argv[1:]
+    refresh = '--refresh' in sys.argv[1:]
+    
+    if not args:
+        print("Usage: python get_channel_id.py <handle_or_url> [--no-stats] [--refresh]")
         print("\nExamples:")
         print("  python get_channel_id.py @SnaxGaming")
         print("  python get_channel_id.py SnaxGaming")
         print("  python get_channel_id.py https://www.youtube.com/@SnaxGaming")
+        print("  python get_channel_id.py @SnaxGaming --no-stats   (one API call)")
+        print("  python get_channel_id.py @SnaxGaming --refresh    (bypass the cache)")
         sys.exit(1)
     
-    input_str = sys.argv[1]
+    input_str = args[0]
     
     print(f"\n🔍 Looking up channel: {input_str}")
     print("=" * 60)
@@ -118,7 +207,8 @@ def main():
     print(f"Handle: @{handle}\n")
     
     # Get channel details
-    result = get_channel_id_from_handle(handle)
+    result = get_channel_id_from_handle(handle, include_stats=include_stats,
+                                        refresh=refresh)
     
     if 'error' in result:
         print(f"❌ {result['error']}")
@@ -131,9 +221,10 @@ def main():
     print(f"Channel ID:       {result['channel_id']}")
     print(f"Handle:           {result['handle']}")
     print(f"Channel URL:      {result['channel_url']}")
-    print(f"Subscribers:      {result['subscriber_count']}")
-    print(f"Total Videos:     {result['video_count']}")
-    print(f"Total Views:      {result['view_count']}")
+    if include_stats:
+        print(f"Subscribers:      {result['subscriber_count']}")
+        print(f"Total Videos:     {result['video_count']}")
+        print(f"Total Views:      {result['view_count']}")
     print(f"\nDescription:\n{result['description']}")
     print("=" * 60)
     
@@ -10,7 +10,48 @@ from core.config import ConfigManager
 from core.database import DatabaseManager
 from youtube.api_client import YouTubeAPIClient
 from youtube.uploader import VideoUploader
-import sqlite3
+import os
+
+try:
+    from orjson import loads as json_loads  # Optional, faster parser
+except ImportError:
+    from json import loads as json_loads
+
+# Prepended to the original description of every re-upload
+_HEADER = "Re-uploaded from MuFiJuL GaminG"
+
+# Preferred first when a video was downloaded in more than one format
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.webm')
+
+
+def index_session_files(downloads_dir: Path) -> dict:
+    """
+    Map video IDs to downloaded files with one pass over the session folders.
+    
+    Args:
+        downloads_dir: Folder containing the session_* download folders
+        
+    Returns:
+        Dictionary of video ID -> Path of its downloaded video file
+    """
+    found = {}
+    try:
+        sessions = [entry for entry in os.scandir(downloads_dir)
+                    if entry.is_dir() and entry.name.startswith('session_')]
+    except FileNotFoundError:
+        return {}
+    
+    for session in sessions:
+        for entry in os.scandir(session.path):
+            stem, ext = os.path.splitext(entry.name)
+            if ext not in VIDEO_EXTENSIONS:
+                continue
+            rank = VIDEO_EXTENSIONS.index(ext)
+            if stem not in found or rank < found[stem][0]:
+                found[stem] = (rank, entry.path)
+    
+    return {stem: Path(path) for stem, (rank, path) in found.items()}
+
 
 def main():
     print("\n" + "="*80)
@@ -25,11 +66,7 @@ def main():
     db = DatabaseManager(db_path)
     
     # Get failed videos
-    conn = sqlite3.connect('data/videos.db')
-    cursor = conn.cursor()
-    cursor.execute('SELECT source_video_id, source_title, status FROM videos WHERE status = "failed"')
-    failed_videos = cursor.fetchall()
-    conn.close()
+    failed_videos = db.get_failed_videos()
     
     print(f"\n📋 Found {len(failed_videos)} failed videos")
     
@@ -38,8 +75,9 @@ def main():
         return
     
     # Show videos
-    for i, (video_id, title, status) in enumerate(failed_videos, 1):
-        print(f"\n{i}. {video_id}")
+    for i, video in enumerate(failed_videos, 1):
+        title = video['source_title']
+        print(f"\n{i}. {video['source_video_id']}")
         print(f"   Title: {title[:70] if title else 'N/A'}")
     
     # Check for downloaded files
@@ -51,21 +89,16 @@ def main():
     print(f"\n🔍 Looking for downloaded files...")
     
     # Check each failed video for downloaded file
-    for vid_id, title, status in failed_videos:
-        for session_dir in downloads_dir.glob('session_*'):
-            for ext in ['.mp4', '.mkv', '.webm']:
-                test_file = session_dir / f"{vid_id}{ext}"
-                if test_file.exists():
-                    video_id = vid_id
-                    video_title = title
-                    video_file = test_file
-                    print(f"✅ Found: {video_file}")
-                    print(f"   Size: {video_file.stat().st_size / (1024*1024):.1f} MB")
-                    print(f"   Video ID: {video_id}")
-                    break
-            if video_file:
-                break
-        if video_file:
+    session_files = index_session_files(downloads_dir)
+    for video in failed_videos:
+        vid_id = video['source_video_id']
+        if vid_id in session_files:
+            video_id = vid_id
+            video_title = video['source_title']
+            video_file = session_files[vid_id]
+            print(f"✅ Found: {video_file}")
+            print(f"   Size: {video_file.stat().st_size / (1024*1024):.1f} MB")
+            print(f"   Video ID: {video_id}")
             break
     
     if not video_file:
@@ -96,29 +129,21 @@ def main():
     category_id = '20'  # Gaming category (safe default)
     
     if info_json_path.exists():
-        import json
-        with open(info_json_path, 'r', encoding='utf-8') as f:
-            info = json.load(f)
-            tags = info.get('tags', [])
-            categories = info.get('categories', [])
-            if categories and len(categories) > 0:
-                category_id = str(categories[0])
-            original_description = info.get('description', '')
-            print(f"✅ Found metadata: {len(tags)} tags, category: {category_id}")
+        # yt-dlp info files can be several MB; parse the raw bytes directly
+        info = json_loads(info_json_path.read_bytes())
+        tags = info.get('tags') or []
+        categories = info.get('categories') or []
+        if categories:
+            category_id = str(categories[0])
+        original_description = info.get('description') or ''
+        print(f"✅ Found metadata: {len(tags)} tags, category: {category_id}")
     else:
         print(f"⚠️  No .info.json file found, using defaults")
         # Try to get description from database
-        original_description = ''
-        conn = sqlite3.connect('data/videos.db')
-        cursor = conn.cursor()
-        cursor.execute('SELECT source_description FROM videos WHERE source_video_id = ?', (video_id,))
-        row = cursor.fetchone()
-        if row and row[0]:
-            original_description = row[0]
-        conn.close()
+        original_description = db.get_source_description(video_id)
     
     # Prepend custom message to original description
-    final_description = f"Re-uploaded from MuFiJuL GaminG\n\n{original_description}"
+    final_description = f"{_HEADER}\n\n{original_description}" if original_description else _HEADER
     
     try:
         result = uploader.upload(
@@ -29,12 +29,11 @@ def main():
         print("✓ Old token deleted")
         print()
     
-    # Check for credentials - try both filenames
-    creds_file = None
-    for filename in ["credentials.json", "client_secrets.json"]:
-        if Path(filename).exists():
-            creds_file = Path(filename)
-            break
+    # Check for credentials - try both filenames (is_file skips same-named dirs)
+    creds_file = next(
+        (path for path in map(Path, ("credentials.json", "client_secrets.json")) if path.is_file()),
+        None
+    )
     
     if not creds_file:
         print("ERROR: OAuth credentials not found!")
@@ -13,15 +13,27 @@ programmatically verified. Manual testing still required for:
 
 import sys
 import os
+import io
 import time
 import json
 import sqlite3
 import psutil
 import platform
 import subprocess
+import shutil
+import threading
+from collections import defaultdict
+from contextlib import closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import re
+import mmap
+import stat
+import importlib.metadata
+import importlib.util
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -36,15 +48,213 @@ except ImportError as e:
     sys.exit(1)
 
 
+@lru_cache(maxsize=None)
+def _load_config() -> ConfigManager:
+    """Load the application config once per run"""
+    return ConfigManager()
+
+
+# Expected environment, built once at import time
+
+_REQUIRED_PYTHON = (3, 8)
+
+_REQUIRED_DIRS = ("src", "tests", "data", "logs", "docs")
+
+# (config key, description)
+_REQUIRED_CONFIG_KEYS = (
+    ("monitoring.check_interval_minutes", "monitoring check interval"),
+    ("download.directory", "download directory"),
+    ("performance.max_concurrent_downloads", "max concurrent downloads"),
+    ("performance.retry_attempts", "retry attempts"),
+    ("active_hours.start", "active hours start"),
+    ("active_hours.end", "active hours end"),
+)
+
+# Required tables and videos columns (actual schema from database.py)
+_REQUIRED_TABLES = ("videos", "settings", "logs", "stats")
+_REQUIRED_COLUMNS = ("id", "source_video_id", "source_title", "status", "created_at")
+
+# (url, should be valid)
+_URL_CASES = (
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", True),
+    ("https://youtu.be/dQw4w9WgXcQ", True),
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10s", True),
+    ("http://www.youtube.com/watch?v=invalid", False),  # HTTP not HTTPS
+    ("https://example.com/video", False),
+    ("not_a_url", False),
+    ("", False),
+    ("javascript:alert(1)", False),
+)
+
+# (path, should be valid) for paths that don't depend on the project root
+_RELATIVE_TEST_PATHS = (
+    ("normal_file.txt", True),  # Relative path within base_dir should be allowed
+    ("../../../etc/passwd", False),  # Traversal outside base_dir should be rejected
+    ("..\\..\\windows\\system32\\config", False),  # Windows traversal should be rejected
+)
+
+_REQUIRED_FILES = (
+    "README.md",
+    "SETUP.md",
+    "requirements.txt",
+    "src/core/config.py",
+    "src/core/database.py",
+    "src/youtube/api_client.py",
+    "src/gui/main_window.py",
+    "docs/USER_GUIDE.md",
+    "docs/TROUBLESHOOTING.md",
+    "docs/API_LIMITS.md",
+)
+
+# Special cases - map package names (with hyphens) to actual import names
+_IMPORT_MAP = {
+    "python-dotenv": "dotenv",
+    "httpx": "httpx",
+    "requests": "requests",
+    "google-api-python-client": "googleapiclient",
+    "google-auth-oauthlib": "google_auth_oauthlib",
+    "google-auth-httplib2": "google_auth_httplib2",
+    "yt-dlp": "yt_dlp",
+    "pyqt5": "PyQt5",
+    "pyqt5-qt5": "PyQt5.QtCore",  # Bundled with PyQt5
+    "pyqt5-sip": "PyQt5.sip",  # Bundled with PyQt5
+    "apscheduler": "apscheduler",
+    "pillow": "PIL",
+    "tqdm": "tqdm",
+    "psutil": "psutil",
+}
+
+# Non-importable packages that are bundled
+_SKIP_PACKAGES = frozenset()
+
+# doc file -> (doc type, keywords it should mention)
+_DOC_FILES = {
+    "README.md": ("Project Overview", ("installation", "features", "usage")),
+    "SETUP.md": ("Setup Guide", ("prerequisites", "python", "ffmpeg", "dependencies")),
+    "docs/USER_GUIDE.md": ("User Guide", ("configuration", "queue", "upload", "dashboard")),
+    "docs/TROUBLESHOOTING.md": ("Troubleshooting", ("authentication", "download", "upload", "error")),
+    "docs/API_LIMITS.md": ("API Limits", ("quota", "limits", "optimization")),
+}
+
+# One case-insensitive alternation per doc, so a single scan finds every keyword
+_DOC_KEYWORD_RES = {
+    doc_file: re.compile(b"|".join(re.escape(k.encode()) for k in keywords), re.IGNORECASE)
+    for doc_file, (_, keywords) in _DOC_FILES.items()
+}
+
+_SECURITY_FILES = (
+    "src/utils/validators.py",
+    "src/utils/file_security.py",
+    "scripts/security_audit.py",
+)
+
+# Shortest idle CPU sample; psutil's readings get coarse below ~0.1s and
+# process CPU time advances in scheduler ticks
+_CPU_IDLE_WINDOW_S = 0.5
+
+# Per-result JSONL log under logs/, rewritten on every run
+_RESULTS_LOG = "uat_results.jsonl"
+
+# Package name at the start of a requirements line; comments, blank lines
+# and pip options (-r, --index-url) don't match, version specifiers,
+# extras and markers are left out
+_REQUIREMENT_RE = re.compile(rb'^[ \t]*([A-Za-z0-9][A-Za-z0-9_.\-]*)', re.M)
+
+# An http:// (not https://) URL pointing at youtube.com
+_HTTP_YOUTUBE_RE = re.compile(rb'http://[^\s"\']*youtube\.com')
+
+
+def _check_case(validate: Callable[[str], Tuple[bool, str]], value: str,
+                expected_valid: bool) -> Tuple[bool, str]:
+    """
+    Run one validator case
+    
+    Args:
+        validate: Validator returning (is_valid, message)
+        value: Input to validate
+        expected_valid: Whether the input should be accepted
+        
+    Returns:
+        Tuple of (case passed, details); raising counts as rejecting the input
+    """
+    try:
+        is_valid, message = validate(value)
+    except Exception as e:
+        if expected_valid:
+            return False, f"Unexpected error: {str(e)}"
+        return True, "Rejected with exception as expected"
+    return (is_valid == expected_valid,
+            f"Expected valid={expected_valid}, Got valid={is_valid}, Message: {message}")
+
+
+def _stat(path) -> Optional[os.stat_result]:
+    """stat() a path, or None if it doesn't exist - one syscall for exists + type"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _normalize_dist_name(name: str) -> str:
+    """Normalize a distribution name for lookups (PEP 503)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@contextmanager
+def _mapped(path) -> Iterator[bytes]:
+    """
+    Map a file read-only for in-place byte searches
+    
+    mmap rejects zero-length files with ValueError, so an empty file yields
+    b"" instead - it supports the same find()/regex searches.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield content
+
+
+def _open_db(db_path: Path) -> sqlite3.Connection:
+    """
+    Open the application database for read-only probing
+    
+    The file is opened read-only, so probing never creates it or changes its
+    journal mode. A single read transaction is started so every probe sees
+    one consistent snapshot; it ends when the connection is closed.
+    """
+    conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True,
+                           isolation_level=None)
+    conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("BEGIN")
+    return conn
+
+
 class UATTestRunner:
     """Automated UAT test executor"""
     
     def __init__(self):
         self.project_root = project_root
+        self._report_dir = project_root / "tests" / "uat"
+        # Fixed for the life of the process; shown in the console and both reports
+        self._platform_info = {
+            "system": platform.system(),
+            "release": platform.release(),
+            "python_version": platform.python_version(),
+        }
         self.results: List[Dict] = []
         self.start_time = datetime.now()
+        self._t0 = time.monotonic()  # Results store ms offsets from here
         self.config: Optional[ConfigManager] = None
         self.db = None  # Will use sqlite3 directly
+        self._lock = threading.Lock()  # Results are shared by worker threads
+        self._output = threading.local()  # Per-scenario console buffer, see _run_scenario
+        self._results_log = None  # Open JSONL stream while run_all_tests is running
+        self._encode = json.JSONEncoder(separators=(",", ":")).encode
+        self._process = psutil.Process()
+        self._cpu_window_start: Optional[float] = None  # See _start_cpu_window
         
     def print_header(self, text: str):
         """Print formatted section header"""
@@ -52,11 +262,28 @@ class UATTestRunner:
         print(f"  {text}")
         print(f"{'='*80}\n")
         
+    def _emit(self, text: str):
+        """Print a line, or buffer it while a pooled scenario is running"""
+        lines = getattr(self._output, 'lines', None)
+        if lines is None:
+            print(text)
+        else:
+            lines.append(text)
+        
+    def _run_scenario(self, scenario: Callable[[], None]) -> str:
+        """Run a scenario on a worker thread and return its console output"""
+        self._output.lines = []
+        try:
+            scenario()
+            return "\n".join(self._output.lines)
+        finally:
+            self._output.lines = None
+        
     def print_test(self, scenario: str, description: str):
         """Print test scenario header"""
-        print(f"\n{'-'*80}")
-        print(f"[TEST] {scenario}: {description}")
-        print(f"{'-'*80}")
+        self._emit(f"\n{'-'*80}")
+        self._emit(f"[TEST] {scenario}: {description}")
+        self._emit(f"{'-'*80}")
         
     def record_result(self, scenario: str, test_name: str, passed: bool, 
                      details: str = "", severity: str = "MEDIUM"):
@@ -67,39 +294,69 @@ class UATTestRunner:
             "passed": passed,
             "details": details,
             "severity": severity,
-            "timestamp": datetime.now().isoformat()
+            "t_ms": int((time.monotonic() - self._t0) * 1000)
         }
-        self.results.append(result)
+        status = "[PASS]" if passed else "[FAIL]"
+        with self._lock:
+            self.results.append(result)
+            if self._results_log:
+                self._results_log.write(self._encode(result) + "\n")
         
         # Print result
-        status = "[PASS]" if passed else "[FAIL]"
-        print(f"{status} - {test_name}")
+        self._emit(f"{status} - {test_name}")
         if details:
-            print(f"   Details: {details}")
+            self._emit(f"   Details: {details}")
             
-    def run_all_tests(self):
-        """Execute all automated UAT tests"""
+    def run_all_tests(self) -> Dict[str, int]:
+        """Execute all automated UAT tests
+        
+        Returns:
+            Summary tallies from generate_report
+        """
         self.print_header("UAT Automated Test Suite - Phase 5 Task 6")
         
         print(f"Test Date: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Platform: {platform.system()} {platform.release()}")
-        print(f"Python: {platform.python_version()}")
+        info = self._platform_info
+        print(f"Platform: {info['system']} {info['release']}")
+        print(f"Python: {info['python_version']}")
         print(f"Python Executable: {sys.executable}")
         print(f"Project Root: {self.project_root}")
         
-        # Test scenarios
-        self.test_environment_setup()
-        self.test_configuration_loading()
-        self.test_database_initialization()
-        self.test_validators()
-        self.test_file_structure()
-        self.test_dependencies()
-        self.test_resource_usage()
-        self.test_documentation_presence()
-        self.test_security_features()
+        # Test scenarios - independent filesystem/subprocess probes overlap
+        # in a thread pool; each one's output is buffered and printed in
+        # scenario order so headers stay with their results
+        scenarios = [
+            self.test_environment_setup,
+            self.test_configuration_loading,
+            self.test_database_initialization,
+            self.test_validators,
+            self.test_file_structure,
+            self.test_dependencies,
+            self.test_documentation_presence,
+            self.test_security_features,
+        ]
+        # Each result is also streamed to a JSONL log as it's recorded, so a
+        # run that dies part way still leaves what it found
+        log_dir = self.project_root / "logs"
+        log_dir.mkdir(exist_ok=True)
+        self._results_log = open(log_dir / _RESULTS_LOG, 'w', encoding='utf-8', buffering=1 << 16)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(self._run_scenario, scenario)
+                           for scenario in scenarios]
+                for future in futures:
+                    print(future.result())
+            
+            # Idle CPU, memory and thread count are measured once the pool is
+            # gone, so the other scenarios' work doesn't show up in them
+            self._start_cpu_window()
+            self.test_resource_usage()
+        finally:
+            self._results_log.close()
+            self._results_log = None
         
         # Generate report
-        self.generate_report()
+        return self.generate_report()
         
     def test_environment_setup(self):
         """TS-ENV: Environment Setup Verification"""
@@ -107,31 +364,31 @@ class UATTestRunner:
         
         # Check Python version
         py_version = sys.version_info
-        required_version = (3, 8)
-        passed = py_version >= required_version
+        passed = py_version >= _REQUIRED_PYTHON
         self.record_result(
             "TS-ENV", 
-            f"Python Version >= {required_version[0]}.{required_version[1]}",
+            f"Python Version >= {_REQUIRED_PYTHON[0]}.{_REQUIRED_PYTHON[1]}",
             passed,
-            f"Found: {platform.python_version()}",
+            f"Found: {self._platform_info['python_version']}",
             "CRITICAL"
         )
         
         # Check OS
-        is_windows = platform.system() == "Windows"
+        info = self._platform_info
+        is_windows = info["system"] == "Windows"
         self.record_result(
             "TS-ENV",
             "Running on Windows",
             is_windows,
-            f"OS: {platform.system()} {platform.release()}",
+            f"OS: {info['system']} {info['release']}",
             "CRITICAL"
         )
         
         # Check project structure
-        required_dirs = ["src", "tests", "data", "logs", "docs"]
-        for dir_name in required_dirs:
+        for dir_name in _REQUIRED_DIRS:
             dir_path = self.project_root / dir_name
-            exists = dir_path.exists() and dir_path.is_dir()
+            st = _stat(dir_path)
+            exists = st is not None and stat.S_ISDIR(st.st_mode)
             self.record_result(
                 "TS-ENV",
                 f"Directory '{dir_name}' exists",
@@ -146,7 +403,7 @@ class UATTestRunner:
         
         try:
             # Load configuration
-            self.config = ConfigManager()
+            self.config = _load_config()
             self.record_result(
                 "TS-002",
                 "Config instance created successfully",
@@ -156,17 +413,9 @@ class UATTestRunner:
             )
             
             # Check required configuration keys
-            required_keys = [
-                ("monitoring.check_interval_minutes", "monitoring check interval"),
-                ("download.directory", "download directory"),
-                ("performance.max_concurrent_downloads", "max concurrent downloads"),
-                ("performance.retry_attempts", "retry attempts"),
-                ("active_hours.start", "active hours start"),
-                ("active_hours.end", "active hours end")
-            ]
-            
-            for key, description in required_keys:
-                value = self.config.get(key)
+            values = {key: self.config.get(key) for key, _ in _REQUIRED_CONFIG_KEYS}
+            for key, description in _REQUIRED_CONFIG_KEYS:
+                value = values[key]
                 has_key = value is not None
                 self.record_result(
                     "TS-002",
@@ -177,7 +426,7 @@ class UATTestRunner:
                 )
                 
             # Validate configuration values
-            max_concurrent = self.config.get('performance.max_concurrent_downloads', 0)
+            max_concurrent = values['performance.max_concurrent_downloads'] or 0
             valid_concurrent = 1 <= max_concurrent <= 10
             self.record_result(
                 "TS-002",
@@ -187,7 +436,7 @@ class UATTestRunner:
                 "MEDIUM"
             )
             
-            retry_attempts = self.config.get('performance.retry_attempts', 0)
+            retry_attempts = values['performance.retry_attempts'] or 0
             valid_retries = 0 <= retry_attempts <= 5
             self.record_result(
                 "TS-002",
@@ -227,74 +476,69 @@ class UATTestRunner:
         try:
             # Initialize database connection directly
             db_path = self.project_root / "data" / "videos.db"
-            self.db = sqlite3.connect(str(db_path))
-            
-            self.record_result(
-                "TS-003",
-                "Database initialized successfully",
-                True,
-                f"Path: {db_path}",
-                "CRITICAL"
-            )
-            
-            # Check database schema
-            cursor = self.db.cursor()
-            
-            # Get table names
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            # Required tables (actual schema from database.py)
-            required_tables = ["videos", "settings", "logs", "stats"]
-            for table in required_tables:
-                exists = table in tables
+            with closing(_open_db(db_path)) as db:
                 self.record_result(
                     "TS-003",
-                    f"Table '{table}' exists",
-                    exists,
-                    f"Tables found: {', '.join(tables)}",
-                    "HIGH"
+                    "Database initialized successfully",
+                    True,
+                    f"Path: {db_path}",
+                    "CRITICAL"
                 )
                 
-            # Check videos table schema (actual columns from database.py)
-            cursor.execute("PRAGMA table_info(videos)")
-            columns = [row[1] for row in cursor.fetchall()]
-            
-            required_columns = ["id", "source_video_id", "source_title", "status", "created_at"]
-            for column in required_columns:
-                exists = column in columns
+                # Check database schema
+                cursor = db.cursor()
+                
+                # Get table names
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                tables = [row[0] for row in cursor.fetchall()]
+                
+                # Required tables (actual schema from database.py)
+                for table in _REQUIRED_TABLES:
+                    exists = table in tables
+                    self.record_result(
+                        "TS-003",
+                        f"Table '{table}' exists",
+                        exists,
+                        f"Tables found: {', '.join(tables)}",
+                        "HIGH"
+                    )
+                
+                # Check videos table schema (actual columns from database.py)
+                cursor.execute("PRAGMA table_info(videos)")
+                columns = [row[1] for row in cursor.fetchall()]
+                
+                for column in _REQUIRED_COLUMNS:
+                    exists = column in columns
+                    self.record_result(
+                        "TS-003",
+                        f"Column 'videos.{column}' exists",
+                        exists,
+                        f"Columns: {', '.join(columns)}",
+                        "MEDIUM"
+                    )
+                
+                # Test database operations
+                cursor.execute("SELECT COUNT(*) FROM videos")
+                count = cursor.fetchone()[0]
                 self.record_result(
                     "TS-003",
-                    f"Column 'videos.{column}' exists",
-                    exists,
-                    f"Columns: {', '.join(columns)}",
-                    "MEDIUM"
+                    "Can query videos table",
+                    True,
+                    f"Current record count: {count}",
+                    "HIGH"
                 )
                 
-            # Test database operations
-            cursor.execute("SELECT COUNT(*) FROM videos")
-            count = cursor.fetchone()[0]
-            self.record_result(
-                "TS-003",
-                "Can query videos table",
-                True,
-                f"Current record count: {count}",
-                "HIGH"
-            )
-            
-            # Check database integrity
-            cursor.execute("PRAGMA integrity_check")
-            integrity_result = cursor.fetchone()[0]
-            is_ok = integrity_result == "ok"
-            self.record_result(
-                "TS-003",
-                "Database integrity check",
-                is_ok,
-                f"Result: {integrity_result}",
-                "CRITICAL"
-            )
-            
-            self.db.close()
+                # Check database integrity
+                cursor.execute("PRAGMA integrity_check")
+                integrity_result = cursor.fetchone()[0]
+                is_ok = integrity_result == "ok"
+                self.record_result(
+                    "TS-003",
+                    "Database integrity check",
+                    is_ok,
+                    f"Result: {integrity_result}",
+                    "CRITICAL"
+                )
             
         except Exception as e:
             self.record_result(
@@ -310,123 +554,32 @@ class UATTestRunner:
         self.print_test("TS-004", "Input Validation and Security")
         
         # Test YouTube URL validation
-        valid_urls = [
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
-            "https://youtu.be/dQw4w9WgXcQ",
-            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10s"
-        ]
-        
-        invalid_urls = [
-            "http://www.youtube.com/watch?v=invalid",  # HTTP not HTTPS
-            "https://example.com/video",
-            "not_a_url",
-            "",
-            "javascript:alert(1)"
-        ]
-        
-        for url in valid_urls:
-            try:
-                is_valid = validate_youtube_url(url)
-                self.record_result(
-                    "TS-004",
-                    f"Valid URL accepted: {url[:50]}...",
-                    is_valid,
-                    "",
-                    "HIGH"
-                )
-            except Exception as e:
-                self.record_result(
-                    "TS-004",
-                    f"Valid URL accepted: {url[:50]}...",
-                    False,
-                    f"Error: {str(e)}",
-                    "HIGH"
-                )
-                
-        for url in invalid_urls:
-            try:
-                is_valid, error_msg = validate_youtube_url(url)
-                # Should be invalid - check that it was rejected
-                self.record_result(
-                    "TS-004",
-                    f"Invalid URL rejected: {url[:50]}...",
-                    not is_valid,  # PASS if validation failed (URL rejected)
-                    f"Error message: {error_msg}",
-                    "HIGH"
-                )
-            except Exception as e:
-                # Exception is also acceptable for invalid URLs
-                self.record_result(
-                    "TS-004",
-                    f"Invalid URL rejected: {url[:50]}...",
-                    True,
-                    "Raised validation error as expected",
-                    "HIGH"
-                )
-                
-        # Test path traversal prevention (from security audit fixes)
-        test_paths = [
-            ("normal_file.txt", True),  # Relative path within base_dir should be allowed
-            ("../../../etc/passwd", False),  # Traversal outside base_dir should be rejected
-            ("..\\..\\windows\\system32\\config", False),  # Windows traversal should be rejected
-            (str(self.project_root / "data" / "test.db"), True)  # Absolute path within base_dir should be allowed
-        ]
+        for url, should_be_valid in _URL_CASES:
+            passed, details = _check_case(validate_youtube_url, url, should_be_valid)
+            label = "Valid URL accepted" if should_be_valid else "Invalid URL rejected"
+            self.record_result("TS-004", f"{label}: {url[:50]}...", passed, details, "HIGH")
+            
+        # Test path traversal prevention (from security audit fixes),
+        # validated against the project data directory
+        validate_path = partial(validate_file_path, allowed_base_dir=self.project_root / "data")
+        test_paths = _RELATIVE_TEST_PATHS + (
+            (str(self.project_root / "data" / "test.db"), True),  # Absolute path within base_dir should be allowed
+        )
         
         for test_path, should_be_valid in test_paths:
-            try:
-                # Validate against project data directory
-                allowed_base = self.project_root / "data"
-                is_valid, error_msg = validate_file_path(test_path, allowed_base_dir=allowed_base)
-                
-                # Check if result matches expectation
-                result_correct = (is_valid == should_be_valid)
-                self.record_result(
-                    "TS-004",
-                    f"Path validation: {test_path[:40]}...",
-                    result_correct,
-                    f"Expected valid={should_be_valid}, Got valid={is_valid}, Message: {error_msg}",
-                    "CRITICAL"  # Path traversal is critical security issue
-                )
-            except Exception as e:
-                # For invalid paths, exception is acceptable
-                if not should_be_valid:
-                    self.record_result(
-                        "TS-004",
-                        f"Path validation: {test_path[:40]}...",
-                        True,
-                        "Rejected with exception as expected",
-                        "CRITICAL"
-                    )
-                else:
-                    self.record_result(
-                        "TS-004",
-                        f"Path validation: {test_path[:40]}...",
-                        False,
-                        f"Unexpected error: {str(e)}",
-                        "CRITICAL"
-                    )
+            passed, details = _check_case(validate_path, test_path, should_be_valid)
+            # Path traversal is critical security issue
+            self.record_result("TS-004", f"Path validation: {test_path[:40]}...", passed, details, "CRITICAL")
                     
     def test_file_structure(self):
         """TS-005: File Structure and Permissions"""
         self.print_test("TS-005", "File Structure and Permissions")
         
         # Check required files
-        required_files = [
-            "README.md",
-            "SETUP.md",
-            "requirements.txt",
-            "src/core/config.py",
-            "src/core/database.py",
-            "src/youtube/api_client.py",
-            "src/gui/main_window.py",
-            "docs/USER_GUIDE.md",
-            "docs/TROUBLESHOOTING.md",
-            "docs/API_LIMITS.md"
-        ]
-        
-        for file_rel_path in required_files:
+        for file_rel_path in _REQUIRED_FILES:
             file_path = self.project_root / file_rel_path
-            exists = file_path.exists() and file_path.is_file()
+            st = _stat(file_path)
+            exists = st is not None and stat.S_ISREG(st.st_mode)
             self.record_result(
                 "TS-005",
                 f"File exists: {file_rel_path}",
@@ -450,9 +603,13 @@ class UATTestRunner:
         data_dir = self.project_root / "data"
         if data_dir.exists():
             # Check ownership/permissions (Windows-specific via icacls)
+            icacls = shutil.which("icacls")
             try:
+                # Don't pay for a process spawn just to get "not found"
+                if icacls is None:
+                    raise FileNotFoundError("icacls not found on PATH")
                 result = subprocess.run(
-                    ["icacls", str(data_dir)],
+                    [icacls, str(data_dir)],
                     capture_output=True,
                     text=True,
                     timeout=5
@@ -494,78 +651,86 @@ class UATTestRunner:
             )
             return
             
-        # Parse requirements
-        with open(requirements_file) as f:
-            requirements = [
-                line.strip().split("==")[0].split(">=")[0].split("<=")[0]
-                for line in f
-                if line.strip() and not line.startswith("#")
-            ]
+        # Parse requirements - the package name at the start of each line
+        requirements = [
+            name.decode()
+            for name in _REQUIREMENT_RE.findall(requirements_file.read_bytes())
+        ]
             
+        # Installed distributions, keyed by normalized (PEP 503) name.
+        # Looked up instead of importing each package, which would run
+        # heavy module-level code (PyQt5, googleapiclient, ...)
+        installed = {
+            _normalize_dist_name(dist.metadata["Name"]): dist.version
+            for dist in importlib.metadata.distributions()
+            if dist.metadata["Name"]
+        }
+        
         # Check if packages are importable
         for package in requirements:
             # Map package names to import names (packages use hyphens, imports use underscores/different names)
             # Start with normalized name
             normalized_package = package.replace("-", "_").lower()
             
-            # Special cases - map package names (with hyphens) to actual import names
-            import_map = {
-                "python-dotenv": "dotenv",
-                "httpx": "httpx",
-                "requests": "requests",
-                "google-api-python-client": "googleapiclient",
-                "google-auth-oauthlib": "google_auth_oauthlib",
-                "google-auth-httplib2": "google_auth_httplib2",
-                "yt-dlp": "yt_dlp",
-                "pyqt5": "PyQt5",
-                "pyqt5-qt5": "PyQt5.QtCore",  # Bundled with PyQt5
-                "pyqt5-sip": "PyQt5.sip",  # Bundled with PyQt5
-                "apscheduler": "apscheduler",
-                "pillow": "PIL",
-                "tqdm": "tqdm",
-                "psutil": "psutil"
-            }
-            
-            # Get the actual import name
-            import_name = import_map.get(package.lower(), normalized_package)
+            # Get the actual import name (special cases in _IMPORT_MAP)
+            import_name = _IMPORT_MAP.get(package.lower(), normalized_package)
             
             # Skip non-importable packages that are bundled
-            skip_packages = []
-            if package.lower() in skip_packages:
+            if package.lower() in _SKIP_PACKAGES:
                 continue
             
+            version = installed.get(_normalize_dist_name(package), "unknown")
             try:
-                __import__(import_name)
+                # find_spec locates the module without executing it
+                # (only parent packages of dotted names get imported)
+                found = importlib.util.find_spec(import_name) is not None
+            except ImportError:
+                found = False
+            except Exception as e:
+                # Other lookup error
                 self.record_result(
                     "TS-006",
                     f"Package '{package}' importable",
-                    True,
-                    f"Import name: {import_name}",
+                    False,
+                    f"Unexpected error: {type(e).__name__}: {str(e)}",
                     "HIGH"
                 )
-            except ImportError as e:
-                # Package not installed
+                continue
+            
+            if found:
                 self.record_result(
                     "TS-006",
                     f"Package '{package}' importable",
-                    False,
-                    f"Import error: {str(e)}",
+                    True,
+                    f"Import name: {import_name}, version: {version}",
                     "HIGH"
                 )
-            except Exception as e:
-                # Other import error
+            else:
+                # Package not installed
                 self.record_result(
                     "TS-006",
                     f"Package '{package}' importable",
                     False,
-                    f"Unexpected error: {type(e).__name__}: {str(e)}",
+                    f"No module named '{import_name}'",
                     "HIGH"
                 )
                 
         # Check FFmpeg (external dependency)
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            # Not on PATH - skip spawning a process just to fail
+            self.record_result(
+                "TS-006",
+                "FFmpeg installed and accessible",
+                False,
+                "Version: Not found (ffmpeg not on PATH)",
+                "HIGH"
+            )
+            return
+            
         try:
             result = subprocess.run(
-                ["ffmpeg", "-version"],
+                [ffmpeg, "-version"],
                 capture_output=True,
                 text=True,
                 timeout=5
@@ -589,25 +754,20 @@ class UATTestRunner:
                 "HIGH"
             )
             
+    def _start_cpu_window(self):
+        """Start the idle CPU sample (non-blocking; read in test_resource_usage)"""
+        self._process.cpu_percent(None)
+        self._cpu_window_start = time.monotonic()
+        
     def test_resource_usage(self):
         """TS-022: Resource Usage - Idle State"""
         self.print_test("TS-022", "Resource Usage - Idle State")
         
         try:
-            # Get current process
-            process = psutil.Process()
-            
-            # CPU usage (measure over 1 second)
-            cpu_percent = process.cpu_percent(interval=1.0)
-            cpu_ok = cpu_percent <= 5.0  # Should be < 1% but allow 5% margin
-            
-            self.record_result(
-                "TS-022",
-                "CPU usage idle < 5%",
-                cpu_ok,
-                f"Current: {cpu_percent:.2f}%",
-                "HIGH"
-            )
+            # Current process; idle CPU is sampled since _start_cpu_window
+            process = self._process
+            if self._cpu_window_start is None:
+                self._start_cpu_window()
             
             # Memory usage
             memory_info = process.memory_info()
@@ -656,6 +816,23 @@ class UATTestRunner:
                     "LOW"
                 )
                 
+            # CPU usage - the checks above already count toward the idle
+            # window, so only wait out whatever is left of it
+            remaining = _CPU_IDLE_WINDOW_S - (time.monotonic() - self._cpu_window_start)
+            if remaining > 0:
+                time.sleep(remaining)
+            cpu_percent = process.cpu_percent(None)
+            self._cpu_window_start = None
+            cpu_ok = cpu_percent <= 5.0  # Should be < 1% but allow 5% margin
+            
+            self.record_result(
+                "TS-022",
+                "CPU usage idle < 5%",
+                cpu_ok,
+                f"Current: {cpu_percent:.2f}%",
+                "HIGH"
+            )
+                
         except Exception as e:
             self.record_result(
                 "TS-022",
@@ -670,18 +847,11 @@ class UATTestRunner:
         self.print_test("TS-025/26/27", "Documentation Presence and Completeness")
         
         # Check documentation files
-        doc_files = {
-            "README.md": ("Project Overview", ["installation", "features", "usage"]),
-            "SETUP.md": ("Setup Guide", ["prerequisites", "python", "ffmpeg", "dependencies"]),
-            "docs/USER_GUIDE.md": ("User Guide", ["configuration", "queue", "upload", "dashboard"]),
-            "docs/TROUBLESHOOTING.md": ("Troubleshooting", ["authentication", "download", "upload", "error"]),
-            "docs/API_LIMITS.md": ("API Limits", ["quota", "limits", "optimization"])
-        }
-        
-        for doc_file, (doc_type, keywords) in doc_files.items():
+        for doc_file, (doc_type, keywords) in _DOC_FILES.items():
             file_path = self.project_root / doc_file
             
-            if not file_path.exists():
+            st = _stat(file_path)
+            if st is None:
                 self.record_result(
                     "TS-DOC",
                     f"{doc_type} exists",
@@ -692,7 +862,7 @@ class UATTestRunner:
                 continue
                 
             # Check file size (should have content)
-            file_size = file_path.stat().st_size
+            file_size = st.st_size
             has_content = file_size > 1000  # At least 1 KB
             
             self.record_result(
@@ -705,11 +875,14 @@ class UATTestRunner:
             
             # Check for keywords
             try:
-                with open(file_path, encoding='utf-8') as f:
-                    content = f.read().lower()
+                content = file_path.read_bytes()
+                found = {m.lower().decode() for m in _DOC_KEYWORD_RES[doc_file].findall(content)}
                     
                 for keyword in keywords:
-                    has_keyword = keyword.lower() in content
+                    # A keyword that only occurs inside a longer one's match is
+                    # hidden from the combined scan, so confirm misses directly
+                    has_keyword = keyword in found or re.search(
+                        re.escape(keyword.encode()), content, re.IGNORECASE) is not None
                     self.record_result(
                         "TS-DOC",
                         f"{doc_type} mentions '{keyword}'",
@@ -731,13 +904,7 @@ class UATTestRunner:
         self.print_test("TS-SECURITY", "Security Features Verification")
         
         # Check security utilities exist
-        security_files = [
-            "src/utils/validators.py",
-            "src/utils/file_security.py",
-            "scripts/security_audit.py"
-        ]
-        
-        for sec_file in security_files:
+        for sec_file in _SECURITY_FILES:
             file_path = self.project_root / sec_file
             exists = file_path.exists()
             
@@ -751,12 +918,10 @@ class UATTestRunner:
             
             # Check for security functions
             if exists and sec_file == "src/utils/validators.py":
-                with open(file_path) as f:
-                    content = f.read()
-                    
                 # Check for path traversal prevention (resolve + relative_to)
-                has_resolve = ".resolve()" in content
-                has_relative_to = ".relative_to(" in content
+                with _mapped(file_path) as content:
+                    has_resolve = content.find(b".resolve()") != -1
+                    has_relative_to = content.find(b".relative_to(") != -1
                 
                 self.record_result(
                     "TS-SECURITY",
@@ -767,17 +932,21 @@ class UATTestRunner:
                 )
                 
         # Check HTTPS enforcement in tests
-        test_files = list((self.project_root / "tests").rglob("*.py"))
+        test_files = [
+            (os.path.join(dirpath, name), name)
+            for dirpath, _, filenames in os.walk(self.project_root / "tests")
+            for name in filenames
+            if name.endswith(".py")
+        ]
         http_urls_found = []
         
-        for test_file in test_files:
+        for test_path, test_name in test_files:
             try:
-                with open(test_file) as f:
-                    content = f.read()
-                    # Look for HTTP URLs (but ignore comments and specific exceptions)
-                    if 'http://' in content and 'youtube.com' in content:
-                        http_urls_found.append(test_file.name)
-            except:
+                # Scan the mapped bytes in place instead of decoding the file
+                with _mapped(test_path) as content:
+                    if _HTTP_YOUTUBE_RE.search(content):
+                        http_urls_found.append(test_name)
+            except OSError:
                 pass
                 
         https_enforced = len(http_urls_found) == 0
@@ -789,22 +958,36 @@ class UATTestRunner:
             "MEDIUM"
         )
         
-    def generate_report(self):
-        """Generate UAT test report"""
+    def generate_report(self) -> Dict[str, int]:
+        """Generate UAT test report
+        
+        Returns:
+            Dict with total, passed, failed and critical_failed counts
+        """
         self.print_header("UAT Test Results Summary")
         
+        # Overall and by-severity counts in one pass, keeping the failures
+        passed_tests = failed_tests = 0
+        critical_passed = critical_total = high_passed = high_total = 0
+        failed_rows = []
+        for r in self.results:
+            ok = bool(r["passed"])
+            severity = r["severity"]
+            if severity == "CRITICAL":
+                critical_total += 1
+                critical_passed += ok
+            elif severity == "HIGH":
+                high_total += 1
+                high_passed += ok
+            passed_tests += ok
+            failed_tests += not ok
+            if not ok:
+                failed_rows.append((severity, r["scenario"], r["test_name"], r["details"]))
+            
         # Calculate statistics
-        total_tests = len(self.results)
-        passed_tests = sum(1 for r in self.results if r["passed"])
-        failed_tests = total_tests - passed_tests
+        total_tests = passed_tests + failed_tests
         pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         
-        # Count by severity
-        critical_passed = sum(1 for r in self.results if r["passed"] and r["severity"] == "CRITICAL")
-        critical_total = sum(1 for r in self.results if r["severity"] == "CRITICAL")
-        high_passed = sum(1 for r in self.results if r["passed"] and r["severity"] == "HIGH")
-        high_total = sum(1 for r in self.results if r["severity"] == "HIGH")
-        
         # Print summary
         print(f"[SUMMARY] Test Execution Summary")
         print(f"{'-'*80}")
@@ -834,72 +1017,92 @@ class UATTestRunner:
         print(f"Recommendation: {recommendation}")
         
         # List failures
-        if failed_tests > 0:
+        if failed_rows:
             print(f"\n[FAILURES] Failed Tests:")
             print(f"{'-'*80}")
-            for result in self.results:
-                if not result["passed"]:
-                    print(f"  [{result['severity']}] {result['scenario']}: {result['test_name']}")
-                    if result["details"]:
-                        print(f"    Details: {result['details']}")
+            for severity, scenario, test_name, details in failed_rows:
+                print(f"  [{severity}] {scenario}: {test_name}")
+                if details:
+                    print(f"    Details: {details}")
                         
-        # Save detailed report
-        self.save_json_report()
-        self.save_markdown_report()
+        # Save detailed report (reusing the tallies above); both files
+        # share one timestamp so they always pair up
+        self._report_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.save_json_report(passed_tests, failed_tests, timestamp)
+        self.save_markdown_report(passed_tests, failed_tests, timestamp)
         
         # Print footer
         duration = (datetime.now() - self.start_time).total_seconds()
         print(f"\n{'-'*80}")
         print(f"Test Duration: {duration:.2f} seconds")
         print(f"Report saved to: tests/uat/")
+        print(f"Results log: logs/{_RESULTS_LOG}")
         print(f"{'='*80}\n")
         
-    def save_json_report(self):
-        """Save results as JSON"""
-        report_dir = self.project_root / "tests" / "uat"
-        report_dir.mkdir(parents=True, exist_ok=True)
+        return {
+            "total": total_tests,
+            "passed": passed_tests,
+            "failed": failed_tests,
+            "critical_failed": critical_total - critical_passed,
+        }
+        
+    def save_json_report(self, passed: int, failed: int, timestamp: str):
+        """Save results as JSON
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = report_dir / f"uat_automated_results_{timestamp}.json"
+        Args:
+            passed: Number of passed results
+            failed: Number of failed results
+            timestamp: Report file name suffix (YYYYmmdd_HHMMSS)
+        """
+        report_file = self._report_dir / f"uat_automated_results_{timestamp}.json"
+        total = passed + failed
         
         report_data = {
             "test_date": self.start_time.isoformat(),
-            "platform": {
-                "system": platform.system(),
-                "release": platform.release(),
-                "python_version": platform.python_version()
-            },
+            "platform": self._platform_info,
             "summary": {
-                "total_tests": len(self.results),
-                "passed": sum(1 for r in self.results if r["passed"]),
-                "failed": sum(1 for r in self.results if not r["passed"]),
-                "pass_rate": (sum(1 for r in self.results if r["passed"]) / len(self.results) * 100) if self.results else 0
-            },
-            "results": self.results
+                "total_tests": total,
+                "passed": passed,
+                "failed": failed,
+                "pass_rate": (passed / total * 100) if total else 0
+            }
         }
         
-        with open(report_file, 'w') as f:
+        # Wall-clock timestamps are only rendered for the saved report
+        def with_timestamp(result: Dict) -> Dict:
+            return {**result, "timestamp": (self.start_time + timedelta(milliseconds=result["t_ms"])).isoformat()}
+        
+        report_data["results"] = [with_timestamp(result) for result in self.results]
+        
+        # A 1 MiB buffer coalesces json.dump's many small writes
+        with open(report_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             json.dump(report_data, f, indent=2)
             
         print(f"[OK] JSON report: {report_file}")
         
-    def save_markdown_report(self):
-        """Save results as Markdown"""
-        report_dir = self.project_root / "tests" / "uat"
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = report_dir / f"uat_automated_results_{timestamp}.md"
+    def save_markdown_report(self, passed: int, failed: int, timestamp: str):
+        """Save results as Markdown
+        
+        Args:
+            passed: Number of passed results
+            failed: Number of failed results
+            timestamp: Report file name suffix (YYYYmmdd_HHMMSS)
+        """
+        report_file = self._report_dir / f"uat_automated_results_{timestamp}.md"
         
         # Calculate stats
-        total = len(self.results)
-        passed = sum(1 for r in self.results if r["passed"])
-        failed = total - passed
+        total = passed + failed
         pass_rate = (passed / total * 100) if total > 0 else 0
         
-        # Generate markdown
-        md_content = f"""# UAT Automated Test Results
+        info = self._platform_info
+        
+        # Generate markdown into an in-memory buffer, written out once at the end
+        buf = io.StringIO()
+        buf.write(f"""# UAT Automated Test Results
 **Date:** {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}  
-**Platform:** {platform.system()} {platform.release()}  
-**Python:** {platform.python_version()}
+**Platform:** {info['system']} {info['release']}  
+**Python:** {info['python_version']}
 
 ## Summary
 - **Total Tests:** {total}
@@ -909,35 +1112,31 @@ class UATTestRunner:
 
 ## Results by Scenario
 
-"""
+""")
         
-        # Group by scenario
-        scenarios = {}
+        # Group by scenario, formatting each table row as it's bucketed
+        scenarios = defaultdict(list)
+        scenario_passed = defaultdict(int)
         for result in self.results:
             scenario = result["scenario"]
-            if scenario not in scenarios:
-                scenarios[scenario] = []
-            scenarios[scenario].append(result)
-            
-        # Write results by scenario
-        for scenario, results in sorted(scenarios.items()):
-            scenario_passed = sum(1 for r in results if r["passed"])
-            scenario_total = len(results)
-            
-            md_content += f"### {scenario} ({scenario_passed}/{scenario_total} passed)\n\n"
-            md_content += "| Test | Status | Severity | Details |\n"
-            md_content += "|------|--------|----------|----------|\n"
-            
-            for result in results:
-                status = "PASS" if result["passed"] else "FAIL"
-                details = result["details"][:50] + "..." if len(result["details"]) > 50 else result["details"]
-                md_content += f"| {result['test_name']} | {status} | {result['severity']} | {details} |\n"
-                
-            md_content += "\n"
+            status = "PASS" if result["passed"] else "FAIL"
+            d = result["details"]
+            details = f"{d[:50]}..." if len(d) > 50 else d
+            scenarios[scenario].append(f"| {result['test_name']} | {status} | {result['severity']} | {details} |\n")
+            scenario_passed[scenario] += bool(result["passed"])
+            
+        # Write results by scenario. Sorted rather than insertion order:
+        # scenarios run in a thread pool, so results arrive interleaved
+        for scenario in sorted(scenarios):
+            rows = scenarios[scenario]
+            buf.write(f"### {scenario} ({scenario_passed[scenario]}/{len(rows)} passed)\n\n")
+            buf.write("| Test | Status | Severity | Details |\n")
+            buf.write("|------|--------|----------|----------|\n")
+            buf.writelines(rows)
+            buf.write("\n")
             
         # Write to file
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        report_file.write_text(buf.getvalue(), encoding='utf-8')
             
         print(f"[OK] Markdown report: {report_file}")
 
@@ -945,15 +1144,12 @@ class UATTestRunner:
 def main():
     """Main entry point"""
     runner = UATTestRunner()
-    runner.run_all_tests()
+    stats = runner.run_all_tests()
     
     # Return exit code based on results
-    failed = sum(1 for r in runner.results if not r["passed"])
-    critical_failed = sum(1 for r in runner.results if not r["passed"] and r["severity"] == "CRITICAL")
-    
-    if critical_failed > 0:
+    if stats["critical_failed"] > 0:
         sys.exit(2)  # Critical failures
-    elif failed > 0:
+    elif stats["failed"] > 0:
         sys.exit(1)  # Non-critical failures
     else:
         sys.exit(0)  # All passed
@@ -17,16 +17,251 @@ import os
 import re
 import json
 import sqlite3
+import argparse
+from functools import partial
+from multiprocessing import Pool
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
 
+try:
+    import re2  # Optional, linear-time engine for the whole-file scans
+except ImportError:
+    re2 = None
+
+
+def _fast_compile(source: str):
+    """Compile a pattern with re2 when it's installed, otherwise with re
+    
+    re2 has no lookarounds or backreferences; patterns it rejects also
+    fall back to re.
+    
+    Args:
+        source: Regular expression source
+        
+    Returns:
+        Compiled pattern supporting search(text, pos)
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(source)
+        except re2.error:
+            pass
+    return re.compile(source)
+
+
+# Patterns for common secrets
+_SECRET_PATTERNS = {
+    'api_key': re.compile(r'(?i)(api[_-]?key|apikey)\s*[=:]\s*["\']([^"\']{20,})["\']'),
+    'password': re.compile(r'(?i)(password|passwd|pwd)\s*[=:]\s*["\']([^"\']+)["\']'),
+    'secret': re.compile(r'(?i)(secret|token)\s*[=:]\s*["\']([^"\']{20,})["\']'),
+    'aws_key': re.compile(r'(?i)(aws[_-]?access[_-]?key[_-]?id)\s*[=:]\s*["\']([A-Z0-9]{20})["\']'),
+    'private_key': re.compile(r'-----BEGIN (RSA |DSA )?PRIVATE KEY-----'),
+    'oauth_token': re.compile(r'(?i)(oauth[_-]?token)\s*[=:]\s*["\']([^"\']{20,})["\']'),
+}
+
+# Patterns indicating potential SQL injection
+_SQL_INJECTION_PATTERNS = (
+    re.compile(r'cursor\.execute\([f"\'].*\{.*\}'),  # f-string in execute
+    re.compile(r'cursor\.execute\(.*\+.*\)'),         # String concatenation
+    re.compile(r'cursor\.execute\(.*%.*\)'),          # % formatting
+    re.compile(r'cursor\.execute\(.*\.format\('),     # .format() method
+)
+_PARAMETERIZED_QUERY_RE = re.compile(r'cursor\.execute\([^,]+,\s*[\(\[]')
+
+# http:// URLs (not https://) other than local addresses; the lookahead
+# keeps this one on re
+_HTTP_URL_RE = re.compile(r'["\']http://(?!localhost|127\.0\.0\.1|192\.168)')
+
+# Patterns for sensitive data in logs
+_SENSITIVE_LOG_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'logger\.(info|debug|warning)\(.*password.*\)',
+    r'logger\.(info|debug|warning)\(.*token.*\)',
+    r'logger\.(info|debug|warning)\(.*api[_-]?key.*\)',
+    r'logger\.(info|debug|warning)\(.*secret.*\)',
+))
+
+
+def _any_of(patterns: Iterable[re.Pattern]) -> re.Pattern:
+    """Combine patterns into one alternation that matches wherever any of them does
+    
+    Args:
+        patterns: Compiled patterns; a leading (?i) or re.IGNORECASE is
+            kept as a scoped (?i:...) group
+        
+    Returns:
+        Compiled alternation (re2 when available)
+    """
+    alternatives = []
+    for pattern in patterns:
+        source = pattern.pattern
+        if source.startswith('(?i)'):
+            source = source[4:]
+        flags = 'i' if pattern.flags & re.IGNORECASE else ''
+        alternatives.append(f'(?{flags}:{source})')
+    return _fast_compile('|'.join(alternatives))
+
+
+_SECRETS_ANY = _any_of(_SECRET_PATTERNS.values())
+_SQL_INJECTION_ANY = _any_of(_SQL_INJECTION_PATTERNS)
+_SENSITIVE_LOG_ANY = _any_of(_SENSITIVE_LOG_PATTERNS)
+
+# Lowercase substrings at least one of which every match of a scanner's
+# patterns contains; files with none of them skip the regexes
+_SECRET_KEYWORDS = (b'api', b'pass', b'pwd', b'secret', b'token', b'aws', b'private key')
+_SQL_INJECTION_KEYWORDS = (b'cursor.execute',)
+_HTTP_URL_KEYWORDS = (b'http://',)
+_SENSITIVE_LOG_KEYWORDS = (b'logger.',)
+
+# UTF-8 for the only non-ASCII characters (İ ı ſ K) that re.IGNORECASE
+# matches against ASCII letters; bytes.lower() can't see those
+_ASCII_CASE_FOLDS = ('\u0130'.encode(), '\u0131'.encode(), '\u017f'.encode(), '\u212a'.encode())
+
+
+def _candidate_lines(content: str, pattern: re.Pattern) -> Iterator[Tuple[int, str]]:
+    """Yield the lines of content that pattern matches somewhere in
+    
+    One search over the whole text finds the next hit and the scan resumes
+    at the following line, so each line is yielded at most once. A hit may
+    run past the end of its line, so callers still check the line itself.
+    
+    re2 re-encodes a str on every search(text, pos) call, so an re2 pattern
+    is run over content encoded once as UTF-8, with byte offsets.
+    
+    Args:
+        content: File text
+        pattern: Pattern to search for (usually an _any_of alternation)
+        
+    Yields:
+        (line_number, line) tuples, 1-based, in file order
+    """
+    is_str = isinstance(pattern, re.Pattern)
+    text = content if is_str else content.encode('utf-8')
+    newline_char = '\n' if is_str else b'\n'
+    pos = 0
+    line_num = 1
+    while True:
+        match = pattern.search(text, pos)
+        if match is None:
+            return
+        hit = match.start()
+        newline = text.rfind(newline_char, pos, hit)
+        start = newline + 1 if newline >= 0 else pos
+        end = text.find(newline_char, hit)
+        if end < 0:
+            end = len(text)
+        line_num += text.count(newline_char, pos, start)
+        line = text[start:end]
+        # A newline byte is always a character boundary in UTF-8
+        yield line_num, line if is_str else line.decode('utf-8')
+        line_num += 1
+        pos = end + 1
+
+
+# Directories never scanned (plus any with "venv" in the name)
+_SKIP_DIRS = frozenset({'__pycache__', '.git'})
+_CONFIG_SUFFIXES = ('.json', '.yaml', '.yml')
+
+# Below this many files a scan stays in-process; starting worker processes
+# costs more than the regex work on a tree this size
+_PARALLEL_MIN_FILES = 200
+
+# A finder takes (file_path, content) and returns (line_number, match_name)
+# hits. They are module-level so worker processes can unpickle them.
+Hit = Tuple[int, str]
+
+
+def _find_secrets(file_path: Path, content: str) -> List[Hit]:
+    """Find hardcoded secrets, skipping example files, placeholders and comments"""
+    is_example = 'example' in str(file_path).lower()
+    hits = []
+    for line_num, line in _candidate_lines(content, _SECRETS_ANY):
+        for pattern_name, pattern in _SECRET_PATTERNS.items():
+            if pattern.search(line):
+                # Exclude example files and comments
+                if is_example or \
+                   'TODO' in line or \
+                   'PLACEHOLDER' in line or \
+                   line.strip().startswith('#'):
+                    continue
+                hits.append((line_num, pattern_name))
+    return hits
+
+
+def _find_sql_injection(file_path: Path, content: str) -> List[Hit]:
+    """Find cursor.execute calls built with string formatting"""
+    hits = []
+    for line_num, line in _candidate_lines(content, _SQL_INJECTION_ANY):
+        for pattern in _SQL_INJECTION_PATTERNS:
+            if pattern.search(line):
+                # Check if it's actually using parameterized queries
+                if ', (' in line or ', [' in line:
+                    continue  # Likely parameterized
+                hits.append((line_num, pattern.pattern))
+    return hits
+
+
+def _find_http_urls(file_path: Path, content: str) -> List[Hit]:
+    """Find non-local http:// URLs outside comments and examples"""
+    hits = []
+    for line_num, line in _candidate_lines(content, _HTTP_URL_RE):
+        # Exclude comments and test URLs
+        if line.strip().startswith('#') or 'example' in line.lower():
+            continue
+        hits.append((line_num, 'http'))
+    return hits
+
+
+def _find_sensitive_logging(file_path: Path, content: str) -> List[Hit]:
+    """Find logger calls that mention passwords, tokens, keys or secrets"""
+    hits = []
+    for line_num, line in _candidate_lines(content, _SENSITIVE_LOG_ANY):
+        for pattern in _SENSITIVE_LOG_PATTERNS:
+            if pattern.search(line):
+                hits.append((line_num, pattern.pattern))
+    return hits
+
+
+def _scan_file(finder: Callable[[Path, str], List[Hit]], keywords: Tuple[bytes, ...],
+               file_path: Path) -> Tuple[List[Hit], Optional[str]]:
+    """Read one file and run a finder over it (runs in worker processes)
+    
+    Files are read as bytes and ruled out with a substring check before
+    any regex runs. The rare file with a character that (?i) folds to an
+    ASCII letter but bytes.lower() doesn't is always scanned.
+    
+    Args:
+        finder: One of the _find_* functions
+        keywords: The finder's keyword pre-filter
+        file_path: File to scan
+        
+    Returns:
+        (hits, error) - error is the message if the file couldn't be scanned
+    """
+    try:
+        data = file_path.read_bytes()
+        # Same text as open(..., 'r', encoding='utf-8'), newlines included;
+        # decoding first still reports files that aren't UTF-8
+        content = data.decode('utf-8')
+        lowered = data.lower()
+        if not any(keyword in lowered for keyword in keywords) and \
+           (data.isascii() or not any(fold in data for fold in _ASCII_CASE_FOLDS)):
+            return [], None
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return finder(file_path, content), None
+    except Exception as e:
+        return [], str(e)
+
 
 class SecurityAuditor:
     """Performs comprehensive security audit"""
     
-    def __init__(self, project_root: str = None):
+    def __init__(self, project_root: str = None, cores: Optional[int] = None):
         self.project_root = Path(project_root or os.getcwd())
+        self.cores = cores or os.cpu_count() or 1
+        self._pool = None  # Worker pool, started on first large scan
+        self._source_files: Optional[Tuple[List[Path], List[Path]]] = None  # See _enumerate_source_files
         self.findings: List[Dict[str, Any]] = []
         self.severity_counts = {'CRITICAL': 0, 'HIGH': 0, 'MEDIUM': 0, 'LOW': 0, 'INFO': 0}
         
@@ -47,61 +282,93 @@ class SecurityAuditor:
         self.findings.append(finding)
         self.severity_counts[severity] += 1
         
+    def _enumerate_source_files(self) -> Tuple[List[Path], List[Path]]:
+        """Walk the project once, collecting files for the content scanners
+        
+        The walk is cached, so every scanner shares it. Virtual environments,
+        __pycache__ and .git are pruned at directory level.
+        
+        Returns:
+            (python_files, config_files) - config files are JSON and YAML
+        """
+        if self._source_files is not None:
+            return self._source_files
+            
+        python_files: List[Path] = []
+        config_files: List[Path] = []
+        pending = [str(self.project_root)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if 'venv' not in name and name not in _SKIP_DIRS:
+                            pending.append(entry.path)
+                        continue
+                    # normcase matches extensions case-insensitively on Windows
+                    suffix = os.path.splitext(os.path.normcase(name))[1]
+                    if suffix == '.py':
+                        python_files.append(Path(entry.path))
+                    elif suffix in _CONFIG_SUFFIXES:
+                        config_files.append(Path(entry.path))
+                        
+        python_files.sort()
+        config_files.sort()
+        self._source_files = (python_files, config_files)
+        return self._source_files
+        
+    def _scan_files(self, files: List[Path], finder: Callable[[Path, str], List[Hit]],
+                    keywords: Tuple[bytes, ...]) -> Iterator[Tuple[Path, List[Hit]]]:
+        """Run a finder over files, across worker processes for large trees
+        
+        Args:
+            files: Files to scan
+            finder: One of the module-level _find_* functions
+            keywords: Substrings a file must contain to be worth scanning
+            
+        Yields:
+            (file_path, hits) for files with hits, in input order
+        """
+        scan = partial(_scan_file, finder, keywords)
+        if self.cores > 1 and len(files) >= _PARALLEL_MIN_FILES:
+            if self._pool is None:
+                self._pool = Pool(self.cores)
+            chunksize = max(1, len(files) // (self.cores * 4))
+            results = self._pool.imap(scan, files, chunksize)
+        else:
+            results = map(scan, files)
+            
+        for file_path, (hits, error) in zip(files, results):
+            if error is not None:
+                print(f"  ⚠️  Error scanning {file_path}: {error}")
+            elif hits:
+                yield file_path, hits
+                
     def scan_hardcoded_secrets(self):
         """Scan for hardcoded secrets, API keys, passwords"""
         print("\n[1/8] Scanning for hardcoded secrets...")
         
-        # Patterns for common secrets
-        patterns = {
-            'api_key': r'(?i)(api[_-]?key|apikey)\s*[=:]\s*["\']([^"\']{20,})["\']',
-            'password': r'(?i)(password|passwd|pwd)\s*[=:]\s*["\']([^"\']+)["\']',
-            'secret': r'(?i)(secret|token)\s*[=:]\s*["\']([^"\']{20,})["\']',
-            'aws_key': r'(?i)(aws[_-]?access[_-]?key[_-]?id)\s*[=:]\s*["\']([A-Z0-9]{20})["\']',
-            'private_key': r'-----BEGIN (RSA |DSA )?PRIVATE KEY-----',
-            'oauth_token': r'(?i)(oauth[_-]?token)\s*[=:]\s*["\']([^"\']{20,})["\']',
-        }
-        
         # Files to scan
-        python_files = list(self.project_root.rglob('*.py'))
-        config_files = list(self.project_root.rglob('*.json')) + \
-                      list(self.project_root.rglob('*.yaml')) + \
-                      list(self.project_root.rglob('*.yml'))
-        
+        python_files, config_files = self._enumerate_source_files()
         all_files = python_files + config_files
         secrets_found = 0
         
-        for file_path in all_files:
-            # Skip virtual environment and test files
-            if 'venv' in str(file_path) or '__pycache__' in str(file_path):
-                continue
-                
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    
-                for line_num, line in enumerate(lines, 1):
-                    for pattern_name, pattern in patterns.items():
-                        if re.search(pattern, line):
-                            # Exclude example files and comments
-                            if 'example' in str(file_path).lower() or \
-                               'TODO' in line or \
-                               'PLACEHOLDER' in line or \
-                               line.strip().startswith('#'):
-                                continue
-                            
-                            secrets_found += 1
-                            self.add_finding(
-                                category='Hardcoded Secrets',
-                                severity='CRITICAL',
-                                title=f'Potential {pattern_name} found',
-                                description=f'Found pattern matching {pattern_name} in code',
-                                file_path=str(file_path.relative_to(self.project_root)),
-                                line=line_num,
-                                recommendation='Move secrets to environment variables or secure credential storage'
-                            )
-            except Exception as e:
-                print(f"  ⚠️  Error scanning {file_path}: {e}")
+        for file_path, hits in self._scan_files(all_files, _find_secrets, _SECRET_KEYWORDS):
+            for line_num, pattern_name in hits:
+                secrets_found += 1
+                self.add_finding(
+                    category='Hardcoded Secrets',
+                    severity='CRITICAL',
+                    title=f'Potential {pattern_name} found',
+                    description=f'Found pattern matching {pattern_name} in code',
+                    file_path=str(file_path.relative_to(self.project_root)),
+                    line=line_num,
+                    recommendation='Move secrets to environment variables or secure credential storage'
+                )
         
         if secrets_found == 0:
             print(f"  ✅ No hardcoded secrets detected")
@@ -172,45 +439,22 @@ class SecurityAuditor:
         """Check for SQL injection vulnerabilities"""
         print("\n[3/8] Checking SQL injection prevention...")
         
-        python_files = list(self.project_root.rglob('*.py'))
+        python_files, _ = self._enumerate_source_files()
         vulnerabilities = 0
         
-        # Patterns indicating potential SQL injection
-        unsafe_patterns = [
-            r'cursor\.execute\([f"\'].*\{.*\}',  # f-string in execute
-            r'cursor\.execute\(.*\+.*\)',         # String concatenation
-            r'cursor\.execute\(.*%.*\)',          # % formatting
-            r'cursor\.execute\(.*\.format\(',     # .format() method
-        ]
-        
-        for file_path in python_files:
-            if 'venv' in str(file_path) or '__pycache__' in str(file_path):
-                continue
-                
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    
-                for line_num, line in enumerate(lines, 1):
-                    for pattern in unsafe_patterns:
-                        if re.search(pattern, line):
-                            # Check if it's actually using parameterized queries
-                            if ', (' in line or ', [' in line:
-                                continue  # Likely parameterized
-                            
-                            vulnerabilities += 1
-                            self.add_finding(
-                                category='SQL Injection',
-                                severity='HIGH',
-                                title='Potential SQL injection vulnerability',
-                                description='SQL query uses string formatting instead of parameterized queries',
-                                file_path=str(file_path.relative_to(self.project_root)),
-                                line=line_num,
-                                recommendation='Use parameterized queries: cursor.execute(query, (param1, param2))'
-                            )
-            except Exception as e:
-                print(f"  ⚠️  Error scanning {file_path}: {e}")
+        for file_path, hits in self._scan_files(python_files, _find_sql_injection,
+                                               _SQL_INJECTION_KEYWORDS):
+            for line_num, _ in hits:
+                vulnerabilities += 1
+                self.add_finding(
+                    category='SQL Injection',
+                    severity='HIGH',
+                    title='Potential SQL injection vulnerability',
+                    description='SQL query uses string formatting instead of parameterized queries',
+                    file_path=str(file_path.relative_to(self.project_root)),
+                    line=line_num,
+                    recommendation='Use parameterized queries: cursor.execute(query, (param1, param2))'
+                )
         
         # Check database.py specifically for proper parameterization
         db_file = self.project_root / 'src' / 'core' / 'database.py'
@@ -218,7 +462,7 @@ class SecurityAuditor:
             with open(db_file, 'r', encoding='utf-8') as f:
                 content = f.read()
                 # Count parameterized queries (good practice)
-                parameterized_count = len(re.findall(r'cursor\.execute\([^,]+,\s*[\(\[]', content))
+                parameterized_count = len(_PARAMETERIZED_QUERY_RE.findall(content))
                 print(f"  ℹ️  Found {parameterized_count} parameterized queries in database.py")
         
         if vulnerabilities == 0:
@@ -296,37 +540,21 @@ class SecurityAuditor:
         """Check that all API calls use HTTPS"""
         print("\n[5/8] Checking HTTPS enforcement...")
         
-        python_files = list(self.project_root.rglob('*.py'))
+        python_files, _ = self._enumerate_source_files()
         http_usage = 0
         
-        for file_path in python_files:
-            if 'venv' in str(file_path) or '__pycache__' in str(file_path):
-                continue
-                
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    
-                for line_num, line in enumerate(lines, 1):
-                    # Check for http:// URLs (not https://)
-                    if re.search(r'["\']http://(?!localhost|127\.0\.0\.1|192\.168)', line):
-                        # Exclude comments and test URLs
-                        if line.strip().startswith('#') or 'example' in line.lower():
-                            continue
-                        
-                        http_usage += 1
-                        self.add_finding(
-                            category='HTTPS Enforcement',
-                            severity='MEDIUM',
-                            title='HTTP URL used instead of HTTPS',
-                            description='Found non-HTTPS URL in API call or configuration',
-                            file_path=str(file_path.relative_to(self.project_root)),
-                            line=line_num,
-                            recommendation='Use HTTPS for all external API calls'
-                        )
-            except Exception as e:
-                print(f"  ⚠️  Error scanning {file_path}: {e}")
+        for file_path, hits in self._scan_files(python_files, _find_http_urls, _HTTP_URL_KEYWORDS):
+            for line_num, _ in hits:
+                http_usage += 1
+                self.add_finding(
+                    category='HTTPS Enforcement',
+                    severity='MEDIUM',
+                    title='HTTP URL used instead of HTTPS',
+                    description='Found non-HTTPS URL in API call or configuration',
+                    file_path=str(file_path.relative_to(self.project_root)),
+                    line=line_num,
+                    recommendation='Use HTTPS for all external API calls'
+                )
         
         # Check YouTube API usage
         api_file = self.project_root / 'src' / 'youtube' / 'api_client.py'
@@ -438,41 +666,22 @@ class SecurityAuditor:
         """Check that sensitive data is not logged"""
         print("\n[8/8] Checking logging security...")
         
-        python_files = list(self.project_root.rglob('*.py'))
+        python_files, _ = self._enumerate_source_files()
         sensitive_logging = 0
         
-        # Patterns for sensitive data in logs
-        sensitive_patterns = [
-            r'logger\.(info|debug|warning)\(.*password.*\)',
-            r'logger\.(info|debug|warning)\(.*token.*\)',
-            r'logger\.(info|debug|warning)\(.*api[_-]?key.*\)',
-            r'logger\.(info|debug|warning)\(.*secret.*\)',
-        ]
-        
-        for file_path in python_files:
-            if 'venv' in str(file_path) or '__pycache__' in str(file_path):
-                continue
-                
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-                    
-                for line_num, line in enumerate(lines, 1):
-                    for pattern in sensitive_patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            sensitive_logging += 1
-                            self.add_finding(
-                                category='Logging Security',
-                                severity='MEDIUM',
-                                title='Potential sensitive data in logs',
-                                description='Logging statement may include passwords, tokens, or keys',
-                                file_path=str(file_path.relative_to(self.project_root)),
-                                line=line_num,
-                                recommendation='Sanitize sensitive data before logging or use DEBUG level'
-                            )
-            except Exception as e:
-                print(f"  ⚠️  Error scanning {file_path}: {e}")
+        for file_path, hits in self._scan_files(python_files, _find_sensitive_logging,
+                                               _SENSITIVE_LOG_KEYWORDS):
+            for line_num, _ in hits:
+                sensitive_logging += 1
+                self.add_finding(
+                    category='Logging Security',
+                    severity='MEDIUM',
+                    title='Potential sensitive data in logs',
+                    description='Logging statement may include passwords, tokens, or keys',
+                    file_path=str(file_path.relative_to(self.project_root)),
+                    line=line_num,
+                    recommendation='Sanitize sensitive data before logging or use DEBUG level'
+                )
         
         if sensitive_logging == 0:
             print(f"  ✅ No sensitive data found in logging statements")
@@ -596,19 +805,30 @@ class SecurityAuditor:
         print(f"Audit Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Run all checks
-        self.scan_hardcoded_secrets()
-        self.check_oauth_security()
-        self.check_sql_injection()
-        self.check_input_validation()
-        self.check_https_enforcement()
-        self.check_dependency_vulnerabilities()
-        self.check_file_permissions()
-        self.check_logging_security()
+        try:
+            self.scan_hardcoded_secrets()
+            self.check_oauth_security()
+            self.check_sql_injection()
+            self.check_input_validation()
+            self.check_https_enforcement()
+            self.check_dependency_vulnerabilities()
+            self.check_file_permissions()
+            self.check_logging_security()
+        finally:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool = None
         
         # Generate report
         self.generate_report()
 
 
 if __name__ == '__main__':
-    auditor = SecurityAuditor()
+    parser = argparse.ArgumentParser(description="Run the security audit")
+    parser.add_argument('--cores', type=int, default=None,
+                        help="Worker processes for file scans (default: all CPUs, 1 disables)")
+    args = parser.parse_args()
+    
+    auditor = SecurityAuditor(cores=args.cores)
     auditor.run_audit()
@@ -23,13 +23,37 @@ class DatabaseManager:
         Args:
             db_path: Path to SQLite database file
         """
+        self._open(db_path)
+        self._init_database()
+    
+    @classmethod
+    def from_cached_schema(cls, schema_sql: str, db_path: str = ":memory:") -> "DatabaseManager":
+        """
+        Create a manager for a new database from previously captured DDL.
+        
+        Runs the schema as one script instead of the step-by-step setup and
+        migrations, so it is only meant for fresh databases (e.g. ":memory:").
+        
+        Args:
+            schema_sql: Schema script from get_schema_sql()
+            db_path: Path to SQLite database file
+        
+        Returns:
+            DatabaseManager with the schema in place
+        """
+        manager = cls.__new__(cls)
+        manager._open(db_path)
+        manager.connection.executescript(schema_sql)
+        return manager
+    
+    def _open(self, db_path: str) -> None:
+        """Set up connection state and connect."""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         self.connection: Optional[sqlite3.Connection] = None
         self._lock = threading.Lock()  # Thread-safe database operations
         self._connect()
-        self._init_database()
     
     def _connect(self) -> None:
         """Establish database connection."""
@@ -89,6 +113,19 @@ class DatabaseManager:
             ON videos(status)
         """)
         
+        # Create index on created_at for "most recent first" listings
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_created_desc
+            ON videos(created_at DESC)
+        """)
+        
+        # Partial index for finished videos that are missing an upload ID
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_videos_status_target
+            ON videos(status, target_video_id)
+            WHERE target_video_id IS NULL
+        """)
+        
         # Logs table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS logs (
@@ -99,10 +136,31 @@ class DatabaseManager:
                 message TEXT NOT NULL,
                 details TEXT,
                 video_id TEXT,
+                category TEXT,
                 FOREIGN KEY (video_id) REFERENCES videos(source_video_id)
             )
         """)
         
+        self._migrate_schema(cursor)
+        
+        # Create index on log timestamp for "most recent first" listings
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_logs_timestamp
+            ON logs(timestamp DESC)
+        """)
+        
+        # Create index on log category so filters use equality, not LIKE scans
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_logs_category_ts
+            ON logs(category, timestamp DESC)
+        """)
+        
+        # Create index on log level so error listings don't scan the table
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_logs_level_ts
+            ON logs(level, timestamp DESC)
+        """)
+        
         # Statistics table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS stats (
@@ -127,9 +185,101 @@ class DatabaseManager:
             )
         """)
         
+        self._init_status_counts(cursor)
+        
         self.connection.commit()
         print("Database schema initialized")
     
+    def _init_status_counts(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Create the status_counts table and the triggers that maintain it.
+        
+        Per-status video counts are kept up to date on every insert, status
+        change and delete, so status summaries are a point read instead of a
+        GROUP BY scan over videos.
+        
+        Args:
+            cursor: Cursor on the open connection
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'status_counts'"
+        )
+        exists = cursor.fetchone() is not None
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS status_counts (
+                status TEXT PRIMARY KEY,
+                n INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_videos_status_insert
+            AFTER INSERT ON videos
+            BEGIN
+                INSERT INTO status_counts (status, n) VALUES (NEW.status, 1)
+                ON CONFLICT(status) DO UPDATE SET n = n + 1;
+            END
+        """)
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_videos_status_update
+            AFTER UPDATE OF status ON videos
+            WHEN OLD.status IS NOT NEW.status
+            BEGIN
+                UPDATE status_counts SET n = n - 1 WHERE status = OLD.status;
+                INSERT INTO status_counts (status, n) VALUES (NEW.status, 1)
+                ON CONFLICT(status) DO UPDATE SET n = n + 1;
+            END
+        """)
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_videos_status_delete
+            AFTER DELETE ON videos
+            BEGIN
+                UPDATE status_counts SET n = n - 1 WHERE status = OLD.status;
+            END
+        """)
+        
+        # Seed from existing rows the first time the table is created
+        if not exists:
+            cursor.execute("""
+                INSERT INTO status_counts (status, n)
+                SELECT status, COUNT(*) FROM videos GROUP BY status
+            """)
+    
+    def _migrate_schema(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Add columns introduced after the initial schema to existing databases.
+        
+        Args:
+            cursor: Cursor on the open connection
+        """
+        cursor.execute("PRAGMA table_info(logs)")
+        log_columns = {row[1] for row in cursor.fetchall()}
+        
+        if 'category' not in log_columns:
+            cursor.execute("ALTER TABLE logs ADD COLUMN category TEXT")
+    
+    def get_schema_sql(self) -> str:
+        """
+        Get the current schema (tables, indexes, triggers) as one SQL script.
+        
+        Returns:
+            Schema script usable with from_cached_schema()
+        """
+        if not self.connection:
+            return ""
+        
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT sql FROM sqlite_master
+            WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%'
+            ORDER BY rowid
+        """)
+        
+        return "".join(f"{row[0]};\n" for row in cursor.fetchall())
+    
     def add_video(self, video_data: Dict[str, Any]) -> Optional[int]:
         """
         Add a new video record.
@@ -170,6 +320,48 @@ class DatabaseManager:
             print(f"Error adding video: {e}")
             return None
     
+    def add_videos_bulk(self, videos: List[Dict[str, Any]]) -> int:
+        """
+        Add many video records in a single transaction.
+        
+        Videos that already exist are skipped rather than aborting the batch.
+        
+        Args:
+            videos: List of dictionaries containing video information
+        
+        Returns:
+            Number of videos inserted
+        """
+        if not self.connection:
+            return 0
+        
+        rows = [
+            (
+                video_data.get('video_id'),
+                video_data.get('title'),
+                video_data.get('description'),
+                video_data.get('published_at'),
+                video_data.get('thumbnail_url'),
+                video_data.get('status', 'pending'),
+                json.dumps(video_data.get('metadata', {}))
+            )
+            for video_data in videos
+        ]
+        
+        try:
+            with self._lock:
+                with self.connection:  # One commit for the whole batch
+                    cursor = self.connection.executemany("""
+                        INSERT OR IGNORE INTO videos (
+                            source_video_id, source_title, source_description,
+                            source_published_at, source_thumbnail_url, status, metadata
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, rows)
+                return max(cursor.rowcount, 0)
+        except sqlite3.Error as e:
+            print(f"Error adding videos: {e}")
+            return 0
+    
     def update_video_status(
         self,
         video_id: str,
@@ -327,6 +519,47 @@ class DatabaseManager:
         
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_failed_videos(self) -> List[Dict[str, Any]]:
+        """
+        Get all videos with 'failed' status from database.
+        
+        Returns:
+            List of failed video dictionaries, oldest first
+        """
+        if not self.connection:
+            return []
+        
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT * FROM videos 
+            WHERE status = 'failed' 
+            ORDER BY id ASC
+        """)
+        
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def get_source_description(self, video_id: str) -> str:
+        """
+        Get the original description of a source video.
+        
+        Args:
+            video_id: Source video ID
+        
+        Returns:
+            Source description, or an empty string if unknown
+        """
+        if not self.connection:
+            return ''
+        
+        cursor = self.connection.cursor()
+        cursor.execute(
+            "SELECT source_description FROM videos WHERE source_video_id = ?",
+            (video_id,)
+        )
+        
+        row = cursor.fetchone()
+        return (row[0] or '') if row else ''
+    
     def get_stats_today(self) -> Dict[str, int | float]:
         """
         Get today's statistics.
@@ -357,6 +590,21 @@ class DatabaseManager:
             'total_size_mb': 0.0
         }
     
+    def get_status_counts(self) -> Dict[str, int]:
+        """
+        Get the number of videos per status.
+        
+        Returns:
+            Dictionary mapping status to video count
+        """
+        if not self.connection:
+            return {}
+        
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT status, n FROM status_counts WHERE n > 0")
+        
+        return {row['status']: row['n'] for row in cursor.fetchall()}
+    
     def increment_stat(self, stat_name: str, amount: int = 1) -> None:
         """
         Increment a statistic for today.
@@ -631,7 +879,8 @@ class DatabaseManager:
         message: str,
         module: Optional[str] = None,
         details: Optional[str] = None,
-        video_id: Optional[str] = None
+        video_id: Optional[str] = None,
+        category: Optional[str] = None
     ) -> None:
         """
         Add log entry to database.
@@ -642,6 +891,7 @@ class DatabaseManager:
             module: Module name
             details: Additional details
             video_id: Related video ID
+            category: Log category (upload, download, monitor) for filtering
         """
         if not self.connection:
             return
@@ -650,9 +900,9 @@ class DatabaseManager:
             try:
                 cursor = self.connection.cursor()
                 cursor.execute("""
-                    INSERT INTO logs (level, module, message, details, video_id)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (level, module, message, details, video_id))
+                    INSERT INTO logs (level, module, message, details, video_id, category)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (level, module, message, details, video_id, category))
                 
                 self.connection.commit()
             except sqlite3.Error as e:
@@ -54,7 +54,7 @@ class EventType(Enum):
     APP_SHUTDOWN = "app_shutdown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Event data structure"""
     type: EventType
@@ -160,6 +160,48 @@ class EventBus:
             except Exception as e:
                 self._logger.error(f"Error in event callback {callback.__name__}: {e}", exc_info=True)
     
+    def publish_many(self, event_type: EventType, payloads: List[Dict[str, Any]], source: str = "unknown") -> None:
+        """
+        Publish several events of the same type
+        
+        Subscribers see one event per payload, exactly as with publish(), but
+        the history and subscriber list are only touched once for the batch.
+        
+        Args:
+            event_type: Type of the events
+            payloads: Event data dictionaries, one per event
+            source: Source component that published the events
+        """
+        events = [
+            Event(
+                type=event_type,
+                timestamp=datetime.now(),
+                data=data or {},
+                source=source
+            )
+            for data in payloads
+        ]
+        
+        with self._lock:
+            # Add to history
+            self._event_history.extend(events)
+            overflow = len(self._event_history) - self._max_history
+            if overflow > 0:
+                del self._event_history[:overflow]
+            
+            # Get subscribers (copy to avoid lock during callback execution)
+            subscribers = self._subscribers.get(event_type, []).copy()
+        
+        self._logger.debug(f"Publishing {len(events)} {event_type.value} events")
+        
+        # Call all subscribers
+        for event in events:
+            for callback in subscribers:
+                try:
+                    callback(event)
+                except Exception as e:
+                    self._logger.error(f"Error in event callback {callback.__name__}: {e}", exc_info=True)
+    
     def get_subscribers(self, event_type: EventType) -> int:
         """Get number of subscribers for an event type"""
         with self._lock:
@@ -218,3 +260,8 @@ def unsubscribe(event_type: EventType, callback: Callable[[Event], None]) -> Non
 def publish(event_type: EventType, data: Dict[str, Any] = None, source: str = "unknown") -> None:
     """Publish an event (convenience function)"""
     _event_bus.publish(event_type, data, source)
+
+
+def publish_many(event_type: EventType, payloads: List[Dict[str, Any]], source: str = "unknown") -> None:
+    """Publish several events of one type (convenience function)"""
+    _event_bus.publish_many(event_type, payloads, source)
@@ -72,6 +72,28 @@ def setup_logger(
     return logger
 
 
+# Categories stored with database log entries (checked in this order)
+LOG_CATEGORIES = ('upload', 'download', 'monitor')
+
+
+def get_log_category(module: Optional[str], message: str) -> Optional[str]:
+    """
+    Determine the category of a log entry from its module and message.
+    
+    Args:
+        module: Module or logger name that produced the entry
+        message: Log message
+    
+    Returns:
+        Matching category from LOG_CATEGORIES, or None
+    """
+    text = f"{module or ''} {message}".lower()
+    for category in LOG_CATEGORIES:
+        if category in text:
+            return category
+    return None
+
+
 class LoggerAdapter:
     """Adapter to integrate Python logging with database logging."""
     
@@ -93,7 +115,7 @@ class LoggerAdapter:
         Args:
             level: Log level
             message: Log message
-            **kwargs: Additional context (module, details, video_id)
+            **kwargs: Additional context (module, details, video_id, category)
         """
         # Log to file/console
         log_method = getattr(self.logger, level.lower())
@@ -101,12 +123,16 @@ class LoggerAdapter:
         
         # Log to database (errors only to avoid bloat)
         if self.db_manager and level in ('ERROR', 'CRITICAL'):
+            module = kwargs.get('module')
             self.db_manager.add_log(
                 level=level,
                 message=message,
-                module=kwargs.get('module'),
+                module=module,
                 details=kwargs.get('details'),
-                video_id=kwargs.get('video_id')
+                video_id=kwargs.get('video_id'),
+                category=kwargs.get('category') or get_log_category(
+                    module or self.logger.name, message
+                )
             )
     
     def debug(self, message: str, **kwargs) -> None:
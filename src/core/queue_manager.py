@@ -4,7 +4,7 @@ Manages the pipeline of video processing: detection → download → upload
 """
 from queue import PriorityQueue, Empty
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
 import logging
@@ -118,6 +118,52 @@ class VideoProcessingQueue:
         self._logger.info(f"Added task to queue: {task}")
         return True
     
+    def add_tasks(self, video_infos: List[Dict[str, Any]], priority: VideoPriority = VideoPriority.NORMAL) -> int:
+        """
+        Add many video tasks to the queue at once
+        
+        Applies the same checks as add_task, but takes the lock once for the
+        whole batch and logs one message instead of one per task.
+        
+        Args:
+            video_infos: Video information dictionaries (each must contain 'video_id')
+            priority: Priority for every task in the batch
+            
+        Returns:
+            Number of tasks added
+        """
+        tasks = []
+        with self._lock:
+            for video_info in video_infos:
+                video_id = video_info.get('video_id')
+                if not video_id:
+                    self._logger.error("Cannot add task without video_id")
+                    continue
+                
+                if video_id in self._processing:
+                    self._logger.warning(f"Video {video_id} is already being processed")
+                    continue
+                
+                if video_id in self._completed:
+                    self._logger.warning(f"Video {video_id} already completed")
+                    continue
+                
+                tasks.append(VideoTask(
+                    priority=priority.value,
+                    timestamp=datetime.now(),
+                    video_id=video_id,
+                    video_info=video_info
+                ))
+        
+        if not tasks:
+            return 0
+        
+        for task in tasks:
+            self._queue.put(task)
+        
+        self._logger.info(f"Added {len(tasks)} tasks to queue")
+        return len(tasks)
+    
     def get_next_task(self, timeout: float = 1.0) -> Optional[VideoTask]:
         """
         Get next task from queue
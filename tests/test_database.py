@@ -128,6 +128,25 @@ class TestDatabaseManager:
         video = db_manager.get_video("nonexistent_id")
         assert video is None
     
+    def test_get_failed_videos(self, db_manager):
+        """Test only failed videos are returned, oldest first."""
+        for video_id in ("a", "b", "c"):
+            db_manager.add_video({"video_id": video_id})
+        db_manager.update_video_status("c", "failed")
+        db_manager.update_video_status("a", "failed")
+        
+        failed = db_manager.get_failed_videos()
+        assert [v["source_video_id"] for v in failed] == ["a", "c"]
+    
+    def test_get_source_description(self, db_manager, sample_video_data):
+        """Test source description lookup."""
+        db_manager.add_video(sample_video_data)
+        db_manager.add_video({"video_id": "no_description"})
+        
+        assert db_manager.get_source_description(sample_video_data["video_id"]) == "Test video description"
+        assert db_manager.get_source_description("no_description") == ""
+        assert db_manager.get_source_description("missing") == ""
+    
     def test_update_video_status(self, db_manager, sample_video_data):
         """Test updating video status."""
         # Add video
@@ -218,6 +237,66 @@ class TestDatabaseManager:
         stats = db_manager.get_stats_today()
         assert stats["videos_downloaded"] == 1
     
+    def test_add_videos_bulk(self, db_manager, sample_video_data):
+        """Test bulk insert skips existing videos and returns the insert count."""
+        db_manager.add_video(sample_video_data)
+        
+        videos = [sample_video_data] + [
+            {"video_id": f"bulk_{i}", "title": f"Bulk {i}"} for i in range(5)
+        ]
+        assert db_manager.add_videos_bulk(videos) == 5
+        assert db_manager.add_videos_bulk([]) == 0
+        
+        video = db_manager.get_video("bulk_3")
+        assert video["source_title"] == "Bulk 3"
+        assert video["status"] == "pending"
+        assert db_manager.get_status_counts() == {"pending": 6}
+    
+    def test_status_counts_follow_changes(self, db_manager):
+        """Test status_counts triggers track inserts, status changes and deletes."""
+        db_manager.add_video({"video_id": "a", "status": "pending"})
+        db_manager.add_video({"video_id": "b", "status": "pending"})
+        assert db_manager.get_status_counts() == {"pending": 2}
+        
+        db_manager.update_video_status("a", "completed")
+        db_manager.update_video_status("a", "completed", error_message=None)
+        assert db_manager.get_status_counts() == {"pending": 1, "completed": 1}
+        
+        db_manager.connection.execute("DELETE FROM videos WHERE source_video_id = 'b'")
+        db_manager.connection.commit()
+        assert db_manager.get_status_counts() == {"completed": 1}
+    
+    def test_status_counts_seeded_for_existing_videos(self, temp_dir):
+        """Test status_counts is seeded when added to a database that has videos."""
+        db_path = Path(temp_dir) / "seed.db"
+        db1 = DatabaseManager(db_path=str(db_path))
+        db1.add_video({"video_id": "a", "status": "failed"})
+        db1.connection.executescript("""
+            DROP TRIGGER trg_videos_status_insert;
+            DROP TRIGGER trg_videos_status_update;
+            DROP TRIGGER trg_videos_status_delete;
+            DROP TABLE status_counts;
+        """)
+        db1.close()
+        
+        db2 = DatabaseManager(db_path=str(db_path))
+        assert db2.get_status_counts() == {"failed": 1}
+        db2.close()
+    
+    def test_from_cached_schema(self, db_manager):
+        """Test a database built from cached DDL matches a normally initialized one."""
+        schema_sql = db_manager.get_schema_sql()
+        cached = DatabaseManager.from_cached_schema(schema_sql)
+        
+        try:
+            assert cached.get_schema_sql() == schema_sql
+            
+            cached.add_video({"video_id": "cached", "status": "pending"})
+            assert cached.get_video("cached") is not None
+            assert cached.get_status_counts() == {"pending": 1}
+        finally:
+            cached.close()
+    
     def test_add_log(self, db_manager):
         """Test adding log entry."""
         db_manager.add_log(
@@ -237,6 +316,52 @@ class TestDatabaseManager:
         assert log["level"] == "INFO"
         assert log["module"] == "test_module"
     
+    def test_add_log_with_category(self, db_manager):
+        """Test log category is stored and indexed."""
+        db_manager.add_log(
+            level="ERROR",
+            message="Upload failed",
+            module="uploader",
+            category="upload"
+        )
+        
+        cursor = db_manager.connection.cursor()
+        cursor.execute("SELECT category FROM logs WHERE message = ?", ("Upload failed",))
+        assert cursor.fetchone()["category"] == "upload"
+        
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        indexes = {row[0] for row in cursor.fetchall()}
+        assert "idx_logs_category_ts" in indexes
+        assert "idx_logs_level_ts" in indexes
+    
+    def test_logs_category_column_migrated(self, temp_dir):
+        """Test category column is added to logs tables created before it existed."""
+        import sqlite3
+        db_path = Path(temp_dir) / "legacy.db"
+        
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("""
+            CREATE TABLE logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                level TEXT NOT NULL,
+                module TEXT,
+                message TEXT NOT NULL,
+                details TEXT,
+                video_id TEXT
+            )
+        """)
+        conn.commit()
+        conn.close()
+        
+        db = DatabaseManager(db_path=str(db_path))
+        db.add_log(level="ERROR", message="Download failed", category="download")
+        
+        cursor = db.connection.cursor()
+        cursor.execute("SELECT category FROM logs")
+        assert cursor.fetchone()["category"] == "download"
+        db.close()
+    
     def test_database_persistence(self, temp_dir):
         """Test database persists after closing."""
         db_path = Path(temp_dir) / "persistent.db"
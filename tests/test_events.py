@@ -152,6 +152,30 @@ class TestEventBus:
         history = self.event_bus.get_event_history()
         assert len(history) <= 1000
     
+    def test_publish_many(self):
+        """Test batch publish delivers one event per payload, in order"""
+        def callback(event):
+            self.received_events.append(event)
+        
+        self.event_bus.subscribe(EventType.VIDEO_DETECTED, callback)
+        self.event_bus.publish_many(
+            EventType.VIDEO_DETECTED,
+            [{'id': 1}, {'id': 2}, None],
+            source='test'
+        )
+        
+        assert [e.data for e in self.received_events] == [{'id': 1}, {'id': 2}, {}]
+        assert all(e.source == 'test' for e in self.received_events)
+        assert len(self.event_bus.get_event_history(EventType.VIDEO_DETECTED)) == 3
+    
+    def test_publish_many_history_limit(self):
+        """Test batch publish respects the history size limit"""
+        self.event_bus.publish_many(EventType.VIDEO_DETECTED, [{'id': i} for i in range(1500)])
+        
+        history = self.event_bus.get_event_history(limit=2000)
+        assert len(history) == 1000
+        assert history[-1].data == {'id': 1499}
+    
     def test_clear_history(self):
         """Test clearing event history"""
         # Publish some events
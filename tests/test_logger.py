@@ -12,7 +12,7 @@ import logging
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from core.logger import setup_logger, LoggerAdapter, close_logger
+from core.logger import setup_logger, LoggerAdapter, close_logger, get_log_category
 
 
 class TestLogger:
@@ -142,3 +142,10 @@ class TestLogger:
         assert "Warning via adapter" in content
         assert "Error via adapter" in content
         assert "Critical via adapter" in content
+    
+    def test_get_log_category(self):
+        """Test log category detection from module and message."""
+        assert get_log_category("uploader", "Request failed") == "upload"
+        assert get_log_category(None, "Download timed out") == "download"
+        assert get_log_category("ChannelMonitor", "Quota exceeded") == "monitor"
+        assert get_log_category(None, "Something else") is None
@@ -113,6 +113,23 @@ class TestVideoProcessingQueue:
         success2 = self.queue.add_task(video_info, VideoPriority.NORMAL)
         assert success2 is False
     
+    def test_add_tasks(self):
+        """Test adding a batch of tasks to queue"""
+        self.queue.add_task({'video_id': 'vid0'}, VideoPriority.NORMAL)
+        task = self.queue.get_next_task(timeout=0.1)
+        assert task.video_id == 'vid0'
+        
+        infos = [{'video_id': f'vid{i}'} for i in range(5)]
+        infos.append({'title': 'No ID'})
+        
+        added = self.queue.add_tasks(infos, VideoPriority.LOW)
+        self.queue.add_task({'video_id': 'urgent'}, VideoPriority.HIGH)
+        
+        # vid0 is processing and the last entry has no video_id
+        assert added == 4
+        assert self.queue.get_queue_size() == 5
+        assert self.queue.get_next_task(timeout=0.1).video_id == 'urgent'
+    
     def test_get_next_task(self):
         """Test retrieving next task from queue"""
         video_info = {'video_id': 'abc123', 'title': 'Test'}